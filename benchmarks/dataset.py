@@ -0,0 +1,236 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+"""Deterministic benchmark dataset for ``mexi_it``.
+
+The same seed and scale always produce the same departments, employees,
+equipment, IT users and requests, so query counts and timings can be
+compared between runs and between databases. The dataset is committed once
+and reused; a marker parameter records the seed and scale it was built with.
+"""
+
+import json
+import random
+from collections import namedtuple
+
+DEFAULT_SCALE = {
+    "departments": 20,
+    "employees": 2000,
+    "it_users": 10,
+    "equipment": 3000,
+    "requests": 20000,
+}
+MARKER = "mexi_it.benchmark_dataset"
+CHUNK = 1000
+
+GROUPS = {
+    "requester": "mexi_it.group_it_request_employee",
+    "approver": "mexi_it.group_it_request_approver",
+    "it": "mexi_it.group_it_request_it",
+}
+
+Dataset = namedtuple(
+    "Dataset", ["departments", "employees", "it_users", "equipment", "personas"]
+)
+
+
+def ensure_user(env, login, group_xmlid):
+    """Return the internal user ``login``, created in ``group_xmlid``."""
+    Users = env["res.users"].with_context(active_test=False)
+    user = Users.search([("login", "=", login)])
+    if not user:
+        user = Users.create(
+            {
+                "name": login,
+                "login": login,
+                "groups_id": [
+                    (4, env.ref("base.group_user").id),
+                    (4, env.ref(group_xmlid).id),
+                ],
+            }
+        )
+    return user
+
+
+def request_vals(rng, employee, request_type=None):
+    """Return create values of a valid draft request of ``employee``."""
+    request_type = request_type or rng.choice(
+        ["support", "support", "support", "asset", "software"]
+    )
+    vals = {
+        "employee_id": employee.id,
+        "request_type": request_type,
+        "priority": rng.choice(["0", "1", "2"]),
+        "description": "Benchmark request %s" % rng.randrange(10**6),
+    }
+    if request_type == "asset":
+        vals.update(
+            asset_category=rng.choice(["laptop", "monitor", "keyboard", "mouse"]),
+            asset_reason=rng.choice(["new_hire", "replacement", "growth"]),
+            asset_qty=rng.randint(1, 3),
+        )
+    elif request_type == "software":
+        vals.update(
+            software_name=rng.choice(["ERP", "CAD", "BI", "VPN"]),
+            software_action=rng.choice(["install", "access"]),
+            access_profile=rng.choice(["basic", "standard", "admin"]),
+            access_validity=rng.choice(["temporary", "permanent"]),
+            business_reason="Benchmark",
+        )
+    else:
+        vals.update(
+            support_category=rng.choice(["email", "network", "printer", "hardware"]),
+            support_impact=rng.choice(["blocker", "degraded", "minor"]),
+        )
+    return vals
+
+
+def load(env, seed=42, scale=None):
+    """Return the dataset for ``seed`` and ``scale``, generating it if needed."""
+    scale = dict(DEFAULT_SCALE, **(scale or {}))
+    signature = json.dumps({"seed": seed, "scale": scale}, sort_keys=True)
+    Param = env["ir.config_parameter"].sudo()
+    if Param.get_param(MARKER) != signature:
+        generate(env, seed, scale)
+        Param.set_param(MARKER, signature)
+        env.cr.commit()
+    return _browse(env)
+
+
+def _browse(env):
+    Employee = env["hr.employee"].with_context(active_test=False)
+    personas = {
+        name: env["res.users"].search([("login", "=", "bench_%s" % name)])
+        for name in GROUPS
+    }
+    return Dataset(
+        departments=env["hr.department"].search(
+            [("name", "=like", "Bench Dept %")], order="name"
+        ),
+        employees=Employee.search(
+            [("name", "=like", "Bench Employee %")], order="name"
+        ),
+        it_users=env["res.users"].search(
+            [("login", "=like", "bench_tech_%")], order="login"
+        ),
+        equipment=env["maintenance.equipment"].search(
+            [("name", "=like", "Bench Equipment %")], order="name"
+        ),
+        personas=personas,
+    )
+
+
+def generate(env, seed, scale):
+    """Create the dataset; records left by a previous scale are reused."""
+    rng = random.Random(seed)
+    env = env(
+        context=dict(
+            env.context,
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_create_nosubscribe=True,
+            mail_notify_force_send=False,
+        )
+    )
+    personas = {
+        name: ensure_user(env, "bench_%s" % name, group)
+        for name, group in GROUPS.items()
+    }
+    it_users = env["res.users"].browse(
+        ensure_user(env, "bench_tech_%02d" % n, GROUPS["it"]).id
+        for n in range(scale["it_users"])
+    )
+
+    Department = env["hr.department"]
+    departments = Department.browse()
+    for n in range(scale["departments"]):
+        name = "Bench Dept %02d" % n
+        department = Department.search([("name", "=", name)])
+        departments |= department or Department.create({"name": name})
+
+    # One manager per department; the approver persona manages the first one
+    Employee = env["hr.employee"].with_context(active_test=False)
+    managers = Employee.browse()
+    for n, department in enumerate(departments):
+        name = "Bench Manager %02d" % n
+        manager = Employee.search([("name", "=", name)]) or Employee.create(
+            {"name": name, "department_id": department.id}
+        )
+        managers |= manager
+    managers[:1].user_id = personas["approver"]
+    departments_managers = list(zip(departments, managers))
+
+    existing = Employee.search_count([("name", "=like", "Bench Employee %")])
+    vals_list = []
+    for n in range(scale["employees"]):
+        department, manager = rng.choice(departments_managers)
+        if n < existing:
+            continue
+        vals_list.append(
+            {
+                "name": "Bench Employee %05d" % n,
+                "department_id": department.id,
+                "parent_id": manager.id,
+            }
+        )
+    for index in range(0, len(vals_list), CHUNK):
+        Employee.create(vals_list[index : index + CHUNK])
+    employees = Employee.search([("name", "=like", "Bench Employee %")], order="name")
+    requester = employees[:1]
+    requester.write(
+        {
+            "user_id": personas["requester"].id,
+            "department_id": departments[:1].id,
+            "parent_id": managers[:1].id,
+        }
+    )
+
+    Equipment = env["maintenance.equipment"]
+    existing = Equipment.search_count([("name", "=like", "Bench Equipment %")])
+    vals_list = []
+    for n in range(scale["equipment"]):
+        owner = rng.choice(employees)
+        if n < existing:
+            continue
+        vals = {"name": "Bench Equipment %05d" % n}
+        if "employee_id" in Equipment._fields:
+            vals["employee_id"] = owner.id
+        if "department_id" in Equipment._fields:
+            vals["department_id"] = owner.department_id.id
+        vals_list.append(vals)
+    for index in range(0, len(vals_list), CHUNK):
+        Equipment.create(vals_list[index : index + CHUNK])
+
+    # Requests go through the regular flow so every stored field is set
+    Request = env["it.request"]
+    existing = Request.with_context(active_test=False).search_count(
+        [("description", "=like", "Benchmark request %")]
+    )
+    vals_list = [
+        request_vals(rng, rng.choice(employees)) for n in range(scale["requests"])
+    ][existing:]
+    for index in range(0, len(vals_list), CHUNK):
+        requests = Request.create(vals_list[index : index + CHUNK])
+        _advance(rng, requests, it_users)
+        env.cr.commit()
+        env.invalidate_all()
+
+
+def _advance(rng, requests, it_users):
+    """Move a random share of ``requests`` along the workflow."""
+    submitted = requests.filtered(lambda r: rng.random() < 0.8)
+    submitted.action_submit()
+    approvable = submitted.filtered(lambda r: r.request_type != "support")
+    approved = approvable.filtered(lambda r: rng.random() < 0.8)
+    rejected = approvable - approved
+    rejected.write({"reject_reason": "Benchmark"})
+    rejected.action_reject()
+    approved.action_approve()
+    startable = (submitted - approvable) | approved
+    startable.filtered(lambda r: not r.assigned_it_user_id).write(
+        {"assigned_it_user_id": rng.choice(it_users).id}
+    )
+    started = startable.filtered(lambda r: rng.random() < 0.7)
+    started.action_start()
+    finished = started.filtered(lambda r: rng.random() < 0.8)
+    finished.write({"resolution": "Benchmark"})
+    finished.action_done()
@@ -0,0 +1,386 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+"""Concurrent end-to-end load test of ``mexi_it`` through JSON-RPC.
+
+Virtual users log into a running Odoo server and loop over their role for
+``--duration`` seconds, with a random think time between operations:
+
+* employees open the home screen, create a request and submit it;
+* approvers open the home screen and approve (or reject) the oldest
+  submitted asset and software requests;
+* technicians open the home screen, pull the next request with
+  ``claim_next`` and finish the ones in progress.
+
+The virtual users are created on the benchmark dataset of ``dataset.py``
+before the run. Calls made during ``--ramp-up`` are not measured. The
+report gives the throughput, the p50/p95/p99 latency of every operation
+and the errors, with serialization failures that reached the client
+counted apart. Odoo retries serialization failures itself: pass the
+server's log file with ``--server-log`` to count those retries. The
+transactions rolled back in the whole database, crons and bus included,
+are reported as an upper bound. Some errors are expected: two approvers
+may pick the same request, and the second one is refused.
+
+Usage::
+
+    python benchmarks/loadtest.py -c odoo.conf -d mexi_bench \\
+        --url http://localhost:8069 --employees 50 --duration 120 \\
+        --server-log /var/log/odoo/odoo.log
+
+Run it against a throwaway database: the created requests are kept.
+"""
+
+import argparse
+import http.cookiejar
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from types import SimpleNamespace
+
+import odoo
+from odoo import SUPERUSER_ID, api
+from odoo.modules.registry import Registry
+
+import dataset
+
+SERIALIZATION_ERRORS = ("SerializationFailure", "could not serialize access")
+# Logged by odoo.service.model when a concurrency error is retried / given up
+RETRY_LOG = "tries left, try again in"
+RETRY_EXHAUSTED_LOG = "maximum number of tries reached"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", help="Odoo configuration file")
+    parser.add_argument("-d", "--database", required=True)
+    parser.add_argument("--url", default="http://localhost:8069")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--approvers", type=int, default=5)
+    parser.add_argument("--technicians", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=60, help="Seconds")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds")
+    parser.add_argument(
+        "--think-time", type=float, default=1.0, help="Mean seconds between calls"
+    )
+    parser.add_argument("--password", default="loadtest")
+    parser.add_argument("--server-log", help="Odoo log file, to count retries")
+    return parser.parse_args()
+
+
+# -----------------------------------------------------------------------------
+# Preparation
+# -----------------------------------------------------------------------------
+def prepare(env, args):
+    """Create the virtual users and return ``[(role, login, employee_id)]``."""
+    data = dataset.load(env, seed=args.seed)
+    users = []
+    free_employees = iter(data.employees.filtered(lambda e: not e.user_id))
+    for n in range(args.employees):
+        user = dataset.ensure_user(
+            env, "bench_vu_employee_%03d" % n, dataset.GROUPS["requester"]
+        )
+        employee = user.employee_ids[:1] or next(free_employees)
+        employee.user_id = user
+        users.append(("employee", user, employee.id))
+    for n in range(args.approvers):
+        user = dataset.ensure_user(
+            env, "bench_vu_approver_%02d" % n, dataset.GROUPS["approver"]
+        )
+        users.append(("approver", user, None))
+    for user in data.it_users[: args.technicians]:
+        users.append(("technician", user, None))
+    for _role, user, _employee_id in users:
+        user.password = args.password
+    env.cr.commit()
+    return [(role, user.login, employee_id) for role, user, employee_id in users]
+
+
+def database_stats(env):
+    """Return the rolled back transactions and deadlocks of the database."""
+    env.cr.execute(
+        "SELECT xact_rollback, deadlocks FROM pg_stat_database WHERE datname = %s",
+        [env.cr.dbname],
+    )
+    return env.cr.fetchone()
+
+
+def log_size(path):
+    return os.path.getsize(path) if path else 0
+
+
+def count_retries(path, offset):
+    """Return ``(retries, exhausted)`` logged by the server after ``offset``."""
+    retries = exhausted = 0
+    with open(path, errors="replace") as file:
+        file.seek(offset)
+        for line in file:
+            retries += RETRY_LOG in line
+            exhausted += RETRY_EXHAUSTED_LOG in line
+    return retries, exhausted
+
+
+# -----------------------------------------------------------------------------
+# Client
+# -----------------------------------------------------------------------------
+class RPCError(Exception):
+    def __init__(self, error):
+        data = error.get("data") or {}
+        super().__init__(data.get("message") or error.get("message"))
+        self.name = data.get("name", "")
+
+    @property
+    def serialization(self):
+        return any(text in "%s %s" % (self.name, self) for text in SERIALIZATION_ERRORS)
+
+
+class Session:
+    """JSON-RPC session of one virtual user, with its own cookies."""
+
+    def __init__(self, url):
+        self.url = url.rstrip("/")
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        self.uid = None
+
+    def rpc(self, route, params):
+        body = json.dumps(
+            {"jsonrpc": "2.0", "method": "call", "params": params, "id": 1}
+        ).encode()
+        request = urllib.request.Request(
+            self.url + route, body, {"Content-Type": "application/json"}
+        )
+        with self.opener.open(request, timeout=120) as response:
+            payload = json.load(response)
+        if "error" in payload:
+            raise RPCError(payload["error"])
+        return payload["result"]
+
+    def login(self, database, login, password):
+        result = self.rpc(
+            "/web/session/authenticate",
+            {"db": database, "login": login, "password": password},
+        )
+        self.uid = result["uid"]
+
+    def call(self, model, method, *args, **kwargs):
+        return self.rpc(
+            "/web/dataset/call_kw/%s/%s" % (model, method),
+            {"model": model, "method": method, "args": list(args), "kwargs": kwargs},
+        )
+
+
+class Stats:
+    def __init__(self, home_screen, measure_from):
+        self.home_screen = home_screen
+        # Calls started during the ramp-up are not recorded
+        self.measure_from = measure_from
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.serialization_errors = 0
+
+    def measure(self, name, function, *args, **kwargs):
+        recorded = time.time() >= self.measure_from
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except RPCError as error:
+            if recorded:
+                with self.lock:
+                    self.errors[name] += 1
+                    self.serialization_errors += error.serialization
+            return None
+        except (urllib.error.URLError, TimeoutError):
+            if recorded:
+                with self.lock:
+                    self.errors[name] += 1
+            return None
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            if recorded:
+                with self.lock:
+                    self.latencies[name].append(elapsed)
+
+
+# -----------------------------------------------------------------------------
+# Scenarios
+# -----------------------------------------------------------------------------
+def home_screen(session, stats):
+    if stats.home_screen:
+        stats.measure("home_screen", session.rpc, "/web/home_screen", {})
+
+
+def call(session, stats, name, method, *args, **kwargs):
+    """Call ``method`` of ``it.request``, measured as ``name``."""
+    return stats.measure(name, session.call, "it.request", method, *args, **kwargs)
+
+
+def employee_step(session, stats, rng, employee_id):
+    home_screen(session, stats)
+    vals = dataset.request_vals(rng, SimpleNamespace(id=employee_id))
+    ids = call(session, stats, "create", "create", vals)
+    if ids:
+        ids = ids if isinstance(ids, list) else [ids]
+        call(session, stats, "action_submit", "action_submit", ids)
+
+
+def approver_step(session, stats, rng, _employee_id):
+    home_screen(session, stats)
+    ids = call(
+        session,
+        stats,
+        "search_pending",
+        "search",
+        [("state", "=", "submitted"), ("request_type", "in", ["asset", "software"])],
+        order="submitted_date, id",
+        limit=5,
+    )
+    if not ids:
+        return
+    record_ids = [rng.choice(ids)]
+    if rng.random() < 0.1:
+        reason = {"reject_reason": "Load test"}
+        call(session, stats, "write_reject_reason", "write", record_ids, reason)
+        call(session, stats, "action_reject", "action_reject", record_ids)
+    else:
+        call(session, stats, "action_approve", "action_approve", record_ids)
+
+
+def technician_step(session, stats, rng, _employee_id):
+    home_screen(session, stats)
+    call(session, stats, "claim_next", "claim_next")
+    in_progress = call(
+        session,
+        stats,
+        "search_in_progress",
+        "search",
+        [("assigned_it_user_id", "=", session.uid), ("state", "=", "in_progress")],
+        order="id",
+        limit=3,
+    )
+    if in_progress:
+        record_ids = [rng.choice(in_progress)]
+        resolution = {"resolution": "Load test"}
+        call(session, stats, "write_resolution", "write", record_ids, resolution)
+        call(session, stats, "action_done", "action_done", record_ids)
+
+
+STEPS = {
+    "employee": employee_step,
+    "approver": approver_step,
+    "technician": technician_step,
+}
+
+
+def virtual_user(args, stats, role, login, employee_id, start_at, stop_at, seed):
+    rng = random.Random(seed)
+    time.sleep(max(0, start_at - time.time()))
+    session = Session(args.url)
+    try:
+        session.login(args.database, login, args.password)
+    except (RPCError, urllib.error.URLError) as error:
+        print("login failed for %s: %s" % (login, error))
+        return
+    while time.time() < stop_at:
+        STEPS[role](session, stats, rng, employee_id)
+        time.sleep(rng.expovariate(1 / args.think_time) if args.think_time else 0)
+
+
+# -----------------------------------------------------------------------------
+# Report
+# -----------------------------------------------------------------------------
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of a sorted list."""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def report(stats, elapsed, rollbacks, deadlocks, retries=None):
+    total = sum(len(values) for values in stats.latencies.values())
+    print(
+        "%-20s %8s %8s %9s %9s %9s %9s"
+        % ("operation", "calls", "errors", "ops/s", "p50 ms", "p95 ms", "p99 ms")
+    )
+    for name in sorted(stats.latencies):
+        values = sorted(stats.latencies[name])
+        print(
+            "%-20s %8s %8s %9.2f %9.1f %9.1f %9.1f"
+            % (
+                name,
+                len(values),
+                stats.errors[name],
+                len(values) / elapsed,
+                percentile(values, 0.50),
+                percentile(values, 0.95),
+                percentile(values, 0.99),
+            )
+        )
+    print("%s calls in %.1f s: %.2f calls/s" % (total, elapsed, total / elapsed))
+    print("serialization failures returned to clients: %s" % stats.serialization_errors)
+    if retries:
+        print("concurrency errors retried by the server: %s" % retries[0])
+        print("requests that ran out of retries: %s" % retries[1])
+    print("transactions rolled back in the database (upper bound): %s" % rollbacks)
+    print("deadlocks: %s" % deadlocks)
+
+
+def main():
+    args = parse_args()
+    odoo.tools.config.parse_config(["-c", args.config] if args.config else [])
+    registry = Registry(args.database)
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {"mail_notify_force_send": False})
+        users = prepare(env, args)
+        has_home_screen = "home.app.sequence" in env
+        rollbacks_before, deadlocks_before = database_stats(env)
+
+    log_offset = log_size(args.server_log)
+    now = time.time()
+    stats = Stats(has_home_screen, now + args.ramp_up)
+    stop_at = now + args.ramp_up + args.duration
+    threads = [
+        threading.Thread(
+            target=virtual_user,
+            args=(
+                args,
+                stats,
+                role,
+                login,
+                employee_id,
+                now + args.ramp_up * index / len(users),
+                stop_at,
+                args.seed + index,
+            ),
+            daemon=True,
+        )
+        for index, (role, login, employee_id) in enumerate(users)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - stats.measure_from
+
+    with registry.cursor() as cr:
+        rollbacks, deadlocks = database_stats(api.Environment(cr, SUPERUSER_ID, {}))
+    retries = args.server_log and count_retries(args.server_log, log_offset)
+    report(
+        stats,
+        elapsed,
+        rollbacks - rollbacks_before,
+        deadlocks - deadlocks_before,
+        retries,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
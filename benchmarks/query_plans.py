@@ -0,0 +1,280 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+"""Check the query plans of the hot ``it.request`` searches at scale.
+
+Seeds a dedicated database with about a million requests spread over five
+years (closed requests older than a year archived, as the archiving cron
+would leave them), then runs EXPLAIN on the queries the UI issues for every
+search view filter and for the kanban grouping, as a requester, an approver
+and an IT operator, so the record rules are part of each query.
+
+A check fails when a selective query still reads ``it_request`` with a
+sequential scan. Queries matching more than ``--max-fraction`` of the table
+are only reported: scanning the heap is the right plan for them.
+
+Usage::
+
+    python benchmarks/query_plans.py -c odoo.conf -d mexi_bench [--rows N]
+
+Run it against a throwaway database with ``mexi_it`` installed; the seeded
+rows are kept between runs (``--reseed`` drops them first).
+"""
+
+import argparse
+import json
+import sys
+
+from lxml import etree
+
+import odoo
+from odoo import SUPERUSER_ID, api
+from odoo.modules.registry import Registry
+from odoo.tools import SQL
+from odoo.tools.safe_eval import safe_eval
+
+from dataset import GROUPS, ensure_user
+
+SEED_PREFIX = "BENCH/"
+EMPLOYEES = 1000
+TECHNICIANS = 20
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", help="Odoo configuration file")
+    parser.add_argument("-d", "--database", required=True)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--reseed", action="store_true")
+    parser.add_argument("--max-fraction", type=float, default=0.1)
+    return parser.parse_args()
+
+
+# -----------------------------------------------------------------------------
+# Dataset
+# -----------------------------------------------------------------------------
+def ensure_employees(env, requester):
+    Employee = env["hr.employee"].with_context(active_test=False)
+    employees = Employee.search([("name", "=like", "Bench Employee %")], order="name")
+    missing = EMPLOYEES - len(employees)
+    if missing > 0:
+        employees |= Employee.create(
+            [
+                {"name": "Bench Employee %05d" % (len(employees) + n)}
+                for n in range(missing)
+            ]
+        )
+    employees[:1].user_id = requester
+    return employees
+
+
+def seed(env, rows, reseed):
+    """Insert ``rows`` requests with SQL, unless they are already there."""
+    cr = env.cr
+    users = {
+        name: ensure_user(env, "bench_%s" % name, group)
+        for name, group in GROUPS.items()
+    }
+    technicians = [
+        ensure_user(env, "bench_tech_%02d" % n, GROUPS["it"]).id
+        for n in range(TECHNICIANS)
+    ]
+    employees = ensure_employees(env, users["requester"])
+    if reseed:
+        cr.execute("DELETE FROM it_request WHERE name LIKE %s", [SEED_PREFIX + "%"])
+    env.flush_all()
+    cr.execute(
+        "SELECT count(*) FROM it_request WHERE name LIKE %s", [SEED_PREFIX + "%"]
+    )
+    if cr.fetchone()[0] >= rows and not stale_seed(cr):
+        return users
+    cr.execute("DELETE FROM it_request WHERE name LIKE %s", [SEED_PREFIX + "%"])
+    # Creation dates are spread evenly over five years. Requests older than
+    # 30 days are closed and closed requests older than a year are archived;
+    # half of the last month is still open.
+    cr.execute(
+        """
+        WITH src AS (
+            SELECT i,
+                   (i * 7919) %% 1825 AS age,
+                   (i * 104729) %% 1000 AS bucket,
+                   (ARRAY['support', 'support', 'support', 'asset', 'software'])
+                       [1 + i %% 5] AS request_type
+              FROM generate_series(1, %(rows)s) AS i
+        ), typed AS (
+            SELECT src.*,
+                   CASE
+                       WHEN age > 30 OR bucket >= 500 THEN
+                           CASE WHEN bucket %% 10 = 0 THEN 'rejected'
+                                ELSE 'done' END
+                       WHEN bucket < 100 THEN 'draft'
+                       WHEN bucket < 250 AND request_type = 'support'
+                           THEN 'submitted'
+                       WHEN bucket < 200 THEN 'submitted'
+                       WHEN bucket < 250 THEN 'approved'
+                       ELSE 'in_progress'
+                   END AS state,
+                   (now() AT TIME ZONE 'UTC') - make_interval(days => age) AS created,
+                   (%(employees)s::int[])[1 + i %% %(employee_count)s] AS employee_id
+              FROM src
+        )
+        INSERT INTO it_request (
+            name, request_type, state, priority, employee_id,
+            requester_user_id, department_id, approver_user_id,
+            assigned_it_user_id, active, state_entered_at,
+            create_uid, create_date, write_uid, write_date
+        )
+        SELECT %(prefix)s || lpad(i::text, 7, '0'),
+               request_type,
+               state,
+               (i %% 3)::text,
+               typed.employee_id,
+               e.user_id,
+               e.department_id,
+               m.user_id,
+               CASE WHEN state IN ('draft', 'submitted') THEN NULL
+                    ELSE (%(technicians)s::int[])[1 + i %% %(technician_count)s]
+               END,
+               NOT (state IN ('done', 'rejected') AND age > 365),
+               created,
+               %(uid)s, created, %(uid)s, created
+          FROM typed
+          JOIN hr_employee e ON e.id = typed.employee_id
+     LEFT JOIN hr_employee m ON m.id = e.parent_id
+        """,
+        {
+            "rows": rows,
+            "prefix": SEED_PREFIX,
+            "employees": employees.ids,
+            "employee_count": len(employees),
+            "technicians": technicians,
+            "technician_count": len(technicians),
+            "uid": SUPERUSER_ID,
+        },
+    )
+    return users
+
+
+def stale_seed(cr):
+    """Tell whether seeded rows disagree with the denormalized employee data,
+    e.g. rows inserted before those columns existed."""
+    cr.execute(
+        """
+        SELECT 1
+          FROM it_request r
+          JOIN hr_employee e ON e.id = r.employee_id
+     LEFT JOIN hr_employee m ON m.id = e.parent_id
+         WHERE r.name LIKE %s
+           AND (r.requester_user_id IS DISTINCT FROM e.user_id
+                OR r.department_id IS DISTINCT FROM e.department_id
+                OR r.approver_user_id IS DISTINCT FROM m.user_id)
+         LIMIT 1
+        """,
+        [SEED_PREFIX + "%"],
+    )
+    return bool(cr.fetchone())
+
+
+def vacuum_analyze(dbname):
+    """Refresh statistics and the visibility map outside a transaction."""
+    with odoo.sql_db.db_connect(dbname).cursor() as cr:
+        cr._cnx.autocommit = True
+        cr.execute("VACUUM ANALYZE it_request")
+
+
+# -----------------------------------------------------------------------------
+# Checks
+# -----------------------------------------------------------------------------
+def search_filters(env):
+    """Yield ``(name, domain)`` for every filter of the search view."""
+    arch = etree.fromstring(env.ref("mexi_it.it_request_view_search").arch)
+    yield "(none)", []
+    for node in arch.iter("filter"):
+        if node.get("domain"):
+            yield node.get("name"), safe_eval(node.get("domain"), {"uid": env.uid})
+
+
+def queries(Request, domain):
+    """Return the list and kanban queries the web client runs for ``domain``."""
+    listing = Request._search(domain, limit=80, order=Request._order)
+    grouped = Request._search(domain)
+    grouped.groupby = SQL.identifier(Request._table, "state")
+    return {
+        "list": listing.select(),
+        "kanban": grouped.select(
+            SQL.identifier(Request._table, "state"), SQL("COUNT(*)")
+        ),
+        "count": Request._search(domain).select(SQL("COUNT(*)")),
+    }
+
+
+def plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def explain(cr, query, table):
+    """Return the scan nodes reading ``table`` in the plan of ``query``."""
+    cr.execute(SQL("EXPLAIN (FORMAT JSON) %s", query))
+    plan = cr.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [
+        node
+        for node in plan_nodes(plan[0]["Plan"])
+        if node.get("Relation Name") == table
+    ]
+
+
+def run_checks(env, users, max_fraction):
+    cr = env.cr
+    cr.execute("SELECT count(*) FROM it_request")
+    total = cr.fetchone()[0] or 1
+    failures = 0
+    for persona, user in users.items():
+        Request = env["it.request"].with_user(user)
+        for name, domain in search_filters(Request.env):
+            sql = queries(Request, domain)
+            cr.execute(sql.pop("count"))
+            fraction = cr.fetchone()[0] / total
+            for shape, query in sql.items():
+                nodes = explain(cr, query, Request._table)
+                scans = ", ".join(
+                    node.get("Index Name") or node["Node Type"] for node in nodes
+                )
+                sequential = any(node["Node Type"] == "Seq Scan" for node in nodes)
+                if not sequential:
+                    status = "ok"
+                elif fraction > max_fraction:
+                    status = "wide"
+                else:
+                    status = "FAIL"
+                    failures += 1
+                print(
+                    "%-4s %-9s %-20s %-6s %6.2f%%  %s"
+                    % (status, persona, name, shape, fraction * 100, scans)
+                )
+    return failures
+
+
+def main():
+    args = parse_args()
+    odoo.tools.config.parse_config(["-c", args.config] if args.config else [])
+    registry = Registry(args.database)
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        users = seed(env, args.rows, args.reseed)
+        cr.commit()
+    vacuum_analyze(args.database)
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        users = {name: user.with_env(env) for name, user in users.items()}
+        failures = run_checks(env, users, args.max_fraction)
+        cr.rollback()
+    if failures:
+        print("%s selective queries use a sequential scan" % failures)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
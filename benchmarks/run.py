@@ -0,0 +1,349 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+"""Query-count and latency benchmarks for ``mexi_it`` and ``home-theme``.
+
+Every key path runs inside a savepoint that is rolled back afterwards, on
+top of the deterministic dataset of ``dataset.py``. The SQL query count is
+measured with ``cr.sql_log_count`` and the wall time with the best of
+``--repeat`` runs, after one warm-up run that fills the ORM caches.
+Pending computations, flushes and precommit hooks (mail tracking) are
+included, as a real request would pay for them before committing.
+
+Paths are compared with the baselines of ``thresholds.json``:
+
+* more queries than the baseline fails the run;
+* a wall time above the baseline times ``time_factor`` fails the run;
+* a bulk path whose extra queries per extra record exceed its recorded
+  slope, or ``max_per_record_queries`` when it has no baseline, is
+  reported as an N+1 and fails the run.
+
+Paths without a baseline are reported as new; ``--strict`` fails on them.
+
+Usage::
+
+    python benchmarks/run.py -c odoo.conf -d mexi_bench [--only PATTERN]
+    python benchmarks/run.py -c odoo.conf -d mexi_bench --record
+
+``--record`` stores the measured values as the new baselines.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+
+from lxml import etree
+
+import odoo
+from odoo import SUPERUSER_ID, api
+from odoo.exceptions import AccessError
+from odoo.modules.registry import Registry
+
+import dataset
+
+THRESHOLDS = os.path.join(os.path.dirname(__file__), "thresholds.json")
+# Headroom added to the measured values when recording baselines
+RECORD_QUERY_MARGIN = 2
+RECORD_SLOPE_MARGIN = 0.5
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", help="Odoo configuration file")
+    parser.add_argument("-d", "--database", required=True)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="*", help="Glob on the path names")
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument(
+        "--strict", action="store_true", help="Fail on paths without a baseline"
+    )
+    return parser.parse_args()
+
+
+# -----------------------------------------------------------------------------
+# Measurement
+# -----------------------------------------------------------------------------
+@contextmanager
+def rolled_back(env):
+    env.cr.execute("SAVEPOINT benchmark")
+    try:
+        yield
+    finally:
+        env.cr.precommit.clear()
+        env.cr.postcommit.clear()
+        env.cr.execute("ROLLBACK TO SAVEPOINT benchmark")
+        env.transaction.clear()
+
+
+def measure(env, setup, run, repeat):
+    """Return ``(queries, milliseconds)`` of ``run(setup())``."""
+    timings = []
+    queries = None
+    for attempt in range(repeat + 1 if repeat > 1 else 1):
+        with rolled_back(env):
+            args = setup()
+            env.flush_all()
+            env.cr.precommit.run()
+            env.invalidate_all()
+            count = env.cr.sql_log_count
+            start = time.perf_counter()
+            run(args)
+            env.flush_all()
+            env.cr.precommit.run()
+            env.flush_all()
+            elapsed = (time.perf_counter() - start) * 1000
+            queries = env.cr.sql_log_count - count
+        if attempt or repeat <= 1:
+            timings.append(elapsed)
+    return queries, min(timings)
+
+
+# -----------------------------------------------------------------------------
+# Paths
+# -----------------------------------------------------------------------------
+def as_user(env, user):
+    return env(user=user.id, context=dict(env.context, mail_notify_force_send=False))
+
+
+def draft_requests(env, data, size, request_type=None, seed=0):
+    """Create ``size`` draft requests of the requester persona's employee."""
+    rng = random.Random(seed)
+    employee = env["hr.employee"].search(
+        [("user_id", "=", data.personas["requester"].id)], limit=1
+    )
+    return env["it.request"].create(
+        [dataset.request_vals(rng, employee, request_type) for _ in range(size)]
+    )
+
+
+def create_paths(env, data):
+    rng = random.Random(0)
+    for size in (1, 100, 10000):
+        vals_list = [
+            dataset.request_vals(rng, rng.choice(data.employees)) for _ in range(size)
+        ]
+        yield (
+            "create[%s]" % size,
+            size,
+            lambda: None,
+            lambda _, vals_list=vals_list: env["it.request"].create(vals_list),
+        )
+
+
+def transition_paths(env, data):
+    requester = as_user(env, data.personas["requester"])
+    approver = as_user(env, data.personas["approver"])
+    it = as_user(env, data.personas["it"])
+
+    def submitted(size, request_type):
+        records = draft_requests(env, data, size, request_type)
+        records.action_submit()
+        return records
+
+    def in_progress(size):
+        records = submitted(size, "support")
+        records.write({"assigned_it_user_id": data.personas["it"].id})
+        records.action_start()
+        records.write({"resolution": "Benchmark"})
+        return records
+
+    def rejectable(size):
+        records = submitted(size, "asset")
+        records.write({"reject_reason": "Benchmark"})
+        return records
+
+    def startable(size):
+        records = submitted(size, "support")
+        records.write({"assigned_it_user_id": data.personas["it"].id})
+        return records
+
+    transitions = [
+        ("submit", requester, lambda size: draft_requests(env, data, size)),
+        ("approve", approver, lambda size: submitted(size, "asset")),
+        ("reject", approver, rejectable),
+        ("start", it, startable),
+        ("done", it, in_progress),
+    ]
+    for action, user_env, prepare in transitions:
+        for size in (1, 100):
+            yield (
+                "action_%s[%s]" % (action, size),
+                size,
+                lambda prepare=prepare, size=size: prepare(size).ids,
+                lambda ids, action=action, user_env=user_env: getattr(
+                    user_env["it.request"].browse(ids), "action_%s" % action
+                )(),
+            )
+
+
+def view_specification(Model, view_type):
+    """Return the ``web_search_read`` specification of a view, like the client."""
+    arch = Model.get_views([(False, view_type)])["views"][view_type]["arch"]
+    specification = {}
+    for node in etree.fromstring(arch).iter("field"):
+        field = Model._fields.get(node.get("name"))
+        if field:
+            specification[field.name] = (
+                {"fields": {"display_name": {}}} if field.relational else {}
+            )
+    return specification
+
+
+def read_paths(env, data):
+    for persona, user in data.personas.items():
+        user_env = as_user(env, user)
+        Request = user_env["it.request"]
+        list_spec = view_specification(Request, "list")
+        kanban_spec = view_specification(Request, "kanban")
+
+        def listing(_, Request=Request, spec=list_spec):
+            Request.web_search_read([], spec, limit=80)
+
+        def kanban(_, Request=Request, spec=kanban_spec):
+            groups = Request.web_read_group([], ["state"], ["state"], lazy=True)
+            for group in groups["groups"]:
+                Request.web_search_read(group["__domain"], spec, limit=40)
+
+        def pivot(_, Report=user_env["it.request.report"]):
+            Report.read_group(
+                [],
+                ["hours_total:avg", "hours_to_start:avg", "nbr:sum"],
+                ["department_id", "state"],
+                lazy=False,
+            )
+
+        yield "list[%s]" % persona, None, lambda: None, listing
+        yield "kanban[%s]" % persona, None, lambda: None, kanban
+        yield "pivot[%s]" % persona, None, lambda: None, pivot
+
+
+def home_screen_paths(env, data):
+    if "home.app.sequence" not in env:
+        return
+    user_env = as_user(env, data.personas["requester"])
+    Menu = user_env["ir.ui.menu"]
+    Sequence = user_env["home.app.sequence"]
+    app_ids = [app["id"] for app in Menu.get_home_screen_apps()]
+    yield "home_screen", None, lambda: None, lambda _: Menu.get_home_screen_data()
+    yield (
+        "home_screen_save_order",
+        None,
+        lambda: Sequence.save_user_order(app_ids),
+        lambda _: Sequence.save_user_order(app_ids[::-1]),
+    )
+
+
+def all_paths(env, data):
+    yield from create_paths(env, data)
+    yield from transition_paths(env, data)
+    yield from read_paths(env, data)
+    yield from home_screen_paths(env, data)
+
+
+# -----------------------------------------------------------------------------
+# Thresholds
+# -----------------------------------------------------------------------------
+def load_thresholds():
+    if not os.path.exists(THRESHOLDS):
+        return {"time_factor": 1.5, "max_per_record_queries": 1.0, "paths": {}}
+    with open(THRESHOLDS) as file:
+        return json.load(file)
+
+
+def save_thresholds(thresholds):
+    with open(THRESHOLDS, "w") as file:
+        json.dump(thresholds, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def slopes(results):
+    """Yield ``(name, queries per extra record)`` between bulk sizes."""
+    by_base = {}
+    for name, (size, queries, _ms) in results.items():
+        if size:
+            by_base.setdefault(name.split("[")[0], []).append((size, queries))
+    for base, points in by_base.items():
+        points.sort()
+        for (small, q_small), (large, q_large) in zip(points, points[1:]):
+            yield "%s[%s-%s]" % (base, small, large), (q_large - q_small) / (
+                large - small
+            )
+
+
+def check(results, thresholds, strict=False):
+    paths = thresholds["paths"]
+    missing = "FAIL baseline" if strict else "new"
+    failures = 0
+    for name, (_size, queries, ms) in results.items():
+        baseline = paths.get(name)
+        if not baseline:
+            status = missing
+        elif queries > baseline["queries"]:
+            status = "FAIL queries"
+        elif ms > baseline["ms"] * thresholds["time_factor"]:
+            status = "FAIL time"
+        else:
+            status = "ok"
+        failures += status.startswith("FAIL")
+        print("%-14s %-30s %7s queries %10.1f ms" % (status, name, queries, ms))
+    for name, slope in slopes(results):
+        # Bulk paths must stay batched even before baselines are recorded
+        limit = paths.get(name, {}).get(
+            "per_record_queries", thresholds.get("max_per_record_queries", 1.0)
+        )
+        if slope > limit:
+            status = "FAIL N+1"
+        elif name not in paths:
+            status = missing
+        else:
+            status = "ok"
+        failures += status.startswith("FAIL")
+        print("%-14s %-30s %7.2f queries/record" % (status, name, slope))
+    return failures
+
+
+def record(results, thresholds):
+    paths = thresholds["paths"]
+    for name, (_size, queries, ms) in results.items():
+        paths[name] = {"queries": queries + RECORD_QUERY_MARGIN, "ms": round(ms, 1)}
+    for name, slope in slopes(results):
+        paths[name] = {"per_record_queries": round(slope + RECORD_SLOPE_MARGIN, 2)}
+    save_thresholds(thresholds)
+
+
+def main():
+    args = parse_args()
+    odoo.tools.config.parse_config(["-c", args.config] if args.config else [])
+    registry = Registry(args.database)
+    results = {}
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {"mail_notify_force_send": False})
+        data = dataset.load(env, seed=args.seed)
+        for name, size, setup, run in all_paths(env, data):
+            if not fnmatch.fnmatch(name, args.only):
+                continue
+            repeat = 1 if size and size >= 1000 else args.repeat
+            try:
+                queries, ms = measure(env, setup, run, repeat)
+            except AccessError:
+                print("%-14s %s" % ("no access", name))
+                continue
+            results[name] = (size, queries, ms)
+        cr.rollback()
+    thresholds = load_thresholds()
+    if args.record:
+        record(results, thresholds)
+        return 0
+    failures = check(results, thresholds, strict=args.strict)
+    if failures:
+        print("%s regressions" % failures)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
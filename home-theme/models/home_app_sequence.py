@@ -15,3 +15,39 @@ class HomeAppSequence(models.Model):
     _sql_constraints = [
         ('user_menu_unique', 'unique(user_id, menu_id)', 'Each app can only have one sequence per user!')
     ]
+
+    @api.model
+    def get_user_sequence_map(self):
+        """
+        Return {menu_id: sequence} with the custom app order of the current user
+        """
+        records = self.sudo().search_fetch(
+            [('user_id', '=', self.env.uid)], ['menu_id', 'sequence']
+        )
+        return {rec.menu_id.id: rec.sequence for rec in records}
+
+    @api.model
+    def save_user_order(self, app_ids):
+        """
+        Save the custom order of apps for the current user
+        app_ids: list of menu IDs in the desired order
+
+        Runs a fixed number of queries whatever the number of apps: rows whose
+        position changed are replaced in one delete and one batched insert.
+        """
+        positions = {menu_id: index for index, menu_id in enumerate(app_ids)}
+        existing = self.sudo().search_fetch(
+            [('user_id', '=', self.env.uid), ('menu_id', 'in', list(positions))],
+            ['menu_id', 'sequence'],
+        )
+        stale = existing.filtered(
+            lambda rec: rec.sequence != positions[rec.menu_id.id]
+        )
+        kept = set((existing - stale).menu_id.ids)
+        stale.unlink()
+        self.sudo().create([
+            {'user_id': self.env.uid, 'menu_id': menu_id, 'sequence': index}
+            for menu_id, index in positions.items()
+            if menu_id not in kept
+        ])
+        return True
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from odoo import models, fields, api
+from contextlib import contextmanager
+
+from odoo import models, fields, api, tools
+from odoo.tools import str2bool
+from odoo.tools.profiler import Profiler
 
 _logger = logging.getLogger(__name__)
 
@@ -35,10 +39,10 @@ class IrUiMenu(models.Model):
                 if not menu:
                     continue
 
-                _logger.info(f"Processing app: {menu.get('name')} (id={app_id})")
-                _logger.info(f"  web_icon: {menu.get('web_icon')}")
-                _logger.info(f"  web_icon_data: {bool(menu.get('web_icon_data'))}")
-                _logger.info(f"  web_icon_data_mimetype: {menu.get('web_icon_data_mimetype')}")
+                _logger.debug(f"Processing app: {menu.get('name')} (id={app_id})")
+                _logger.debug(f"  web_icon: {menu.get('web_icon')}")
+                _logger.debug(f"  web_icon_data: {bool(menu.get('web_icon_data'))}")
+                _logger.debug(f"  web_icon_data_mimetype: {menu.get('web_icon_data_mimetype')}")
 
                 # Get the icon information
                 icon_data = self._parse_menu_icon(menu)
@@ -70,7 +74,7 @@ class IrUiMenu(models.Model):
                     app_data['module_icon_url'] = icon_data['module_icon_url']
 
                 apps_data.append(app_data)
-                _logger.info(f"Added app: {menu['name']} (icon_data keys: {list(icon_data.keys())})")
+                _logger.debug(f"Added app: {menu['name']} (icon_data keys: {list(icon_data.keys())})")
             except Exception as e:
                 _logger.error(f"Error processing menu {app_id}: {e}", exc_info=True)
                 continue
@@ -78,6 +82,101 @@ class IrUiMenu(models.Model):
         _logger.info(f"Returning {len(apps_data)} apps")
         return apps_data
 
+    @api.model
+    def get_home_screen_data(self):
+        """
+        Return data for the home screen dashboard: the apps in the custom
+        order of the current user and the background settings
+        """
+        IrConfigParameter = self.env['ir.config_parameter'].sudo()
+
+        apps = self.sudo().get_home_screen_apps()
+
+        # Apply custom ordering if exists
+        sequence_map = self.env['home.app.sequence'].get_user_sequence_map()
+        _logger.debug(f"Found {len(sequence_map)} custom sequences for user id={self.env.uid}")
+        if sequence_map:
+            # Apps without custom order go to end
+            apps = sorted(apps, key=lambda app: sequence_map.get(app['id'], 9999))
+
+        # Get background settings
+        background_type = IrConfigParameter.get_param('home_theme.background_type', 'gradient')
+        background_image = False
+
+        if background_type == 'image':
+            attachment_id = IrConfigParameter.get_param('home_theme.background_image_attachment_id', False)
+            if attachment_id:
+                attachment = self.env['ir.attachment'].sudo().browse(int(attachment_id))
+                if attachment.exists() and attachment.datas:
+                    # Return base64 encoded image data
+                    background_image = attachment.datas.decode('utf-8') if isinstance(attachment.datas, bytes) else attachment.datas
+
+        background_color = IrConfigParameter.get_param('home_theme.background_color', '#f5f7fa')
+
+        return {
+            'apps': apps,
+            'user_name': self.env.user.sudo().name,
+            'company_name': self.env.company.sudo().name,
+            'background_type': background_type,
+            'background_image': background_image,
+            'background_color': background_color,
+        }
+
+    @api.model
+    @tools.ormcache()
+    def _get_home_screen_profiling_scope(self):
+        """
+        Return (user ids, routes) to profile, or None when profiling is off.
+        Empty sets mean every user or every route.
+        """
+        IrConfigParameter = self.env['ir.config_parameter'].sudo()
+        if not str2bool(IrConfigParameter.get_param('home_theme.profiling', 'False')):
+            return None
+        logins = IrConfigParameter.get_param('home_theme.profiling_logins', '')
+        routes = IrConfigParameter.get_param('home_theme.profiling_routes', '')
+        logins = [login.strip() for login in logins.split(',') if login.strip()]
+        users = self.env['res.users'].with_context(active_test=False).search([('login', 'in', logins)])
+        if logins and not users:
+            return None
+        return (
+            frozenset(users.ids),
+            frozenset(route.strip() for route in routes.split(',') if route.strip()),
+        )
+
+    @contextmanager
+    def _home_screen_profile(self, route):
+        """
+        Capture Python stacks and SQL queries of a home screen route into an
+        ir.profile record when profiling is enabled for it and the current
+        user. Costs a single cached lookup when profiling is off.
+        """
+        scope = self._get_home_screen_profiling_scope()
+        if scope is None or (scope[0] and self.env.uid not in scope[0]) or (scope[1] and route not in scope[1]):
+            yield
+            return
+        with Profiler(
+            collectors=['sql', 'traces_async'],
+            db=self.env.cr.dbname,
+            profile_session='home_theme',
+            description=f"/web/{route} by {self.env.user.login}",
+        ):
+            yield
+        # Keep only the most recent captures. The profiler committed this one
+        # on its own cursor, invisible to the request transaction, so prune
+        # on a new cursor too, skipping rows a concurrent prune is deleting.
+        retention = int(self.env['ir.config_parameter'].sudo().get_param('home_theme.profiling_retention', 20))
+        with self.env.registry.cursor() as cr:
+            cr.execute("""
+                DELETE FROM ir_profile
+                 WHERE id IN (
+                        SELECT id FROM ir_profile
+                         WHERE session = 'home_theme'
+                      ORDER BY id DESC
+                        OFFSET %s
+                           FOR UPDATE SKIP LOCKED
+                 )
+            """, [retention])
+
     def _parse_menu_icon(self, menu):
         """
         Extract icon information from menu dictionary (from load_menus)
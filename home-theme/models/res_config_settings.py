@@ -27,6 +27,28 @@ class ResConfigSettings(models.TransientModel):
         ('image', 'Custom Image'),
     ], string='Background Type', default='gradient', help='Select background type')
 
+    home_profiling = fields.Boolean(
+        string='Profile Home Screen',
+        config_parameter='home_theme.profiling',
+        help='Record Python stacks and SQL queries of the home screen routes as downloadable profiles'
+    )
+    home_profiling_logins = fields.Char(
+        string='Profiled Users',
+        config_parameter='home_theme.profiling_logins',
+        help='Comma-separated logins. Leave empty to profile every user.'
+    )
+    home_profiling_routes = fields.Char(
+        string='Profiled Routes',
+        config_parameter='home_theme.profiling_routes',
+        help='Comma-separated routes among home_screen and home_screen/save_order. Leave empty to profile both.'
+    )
+    home_profiling_retention = fields.Integer(
+        string='Profiles Kept',
+        default=20,
+        config_parameter='home_theme.profiling_retention',
+        help='Older profiles are deleted when a new one is captured'
+    )
+
     # Keep for backward compatibility
     home_use_gradient = fields.Boolean(
         string='Use Gradient Background',
@@ -1,22 +1,35 @@
 {
     "name": "Mexilacteos IT",
     "summary": "IT request module for Mexilacteos",
-    "version": "18.0.1.0.0",
+    "version": "18.0.1.5.0",
     "category": "Services",
     "author": "Mexilacteos",
     "license": "Other proprietary",
     "application": True,
-    "depends": ["base", "mail", "hr", "maintenance"],
+    "depends": ["base", "bus", "mail", "hr", "maintenance"],
     "data": [
         "security/it_request_groups.xml",
         "security/ir.model.access.csv",
         "security/it_request_rules.xml",
         "data/it_request_sequence.xml",
+        "data/it_request_cron.xml",
+        "data/it_request_sla_data.xml",
+        "data/it_request_notification_templates.xml",
         "views/it_request_views.xml",
+        "report/it_request_report_views.xml",
         "views/it_request_dashboard.xml",
+        "views/res_config_settings_views.xml",
+        "views/it_request_technician_load_views.xml",
+        "views/it_request_queue_views.xml",
+        "views/it_request_import_views.xml",
+        "views/it_request_export_views.xml",
+        "views/it_request_sla_views.xml",
+        "views/res_users_views.xml",
     ],
     "assets": {
-        "web.assets_backend": [],
+        "web.assets_backend": [
+            "mexi_it/static/src/js/it_request_live_updates.js",
+        ],
     },
     "images": ["static/description/icon.png"],
 }
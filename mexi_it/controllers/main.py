@@ -0,0 +1,115 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+from odoo import fields, http
+from odoo.exceptions import UserError
+from odoo.http import content_disposition, request
+from odoo.tools import json_default
+
+# Smaller bodies are not worth compressing
+GZIP_MIN_SIZE = 1024
+EXPORT_FORMATS = {
+    "csv": ("_stream_history_csv", "text/csv; charset=utf-8"),
+    "xlsx": (
+        "_stream_history_xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+}
+
+
+class ItRequestApiController(http.Controller):
+    @http.route(
+        "/mexi_it/api/requests",
+        type="http",
+        auth="bearer",
+        methods=["GET"],
+        csrf=False,
+        readonly=True,
+    )
+    def sync_requests(self, cursor=None, since=None, fields=None, limit=None):
+        """Return the requests changed since the previous poll, as JSON.
+
+        Authenticate with ``Authorization: Bearer <API key>``; the key's user
+        record rules apply. Parameters:
+
+        * ``cursor``: ``next_cursor`` of the previous response;
+        * ``since``: ISO datetime (UTC if naive) to start from without cursor;
+        * ``fields``: comma separated stored fields, ``id`` always included;
+        * ``limit``: page size, at most 5000.
+
+        Poll again with ``next_cursor`` while ``has_more`` is true. Archived
+        requests are included, with ``active`` false; deleted requests are
+        not reported.
+        """
+        try:
+            page = request.env["it.request"]._get_sync_page(
+                cursor=cursor,
+                since=since and self._parse_datetime(since),
+                fields=fields and [name.strip() for name in fields.split(",")],
+                limit=int(limit) if limit else None,
+            )
+        except (UserError, ValueError) as error:
+            return request.make_json_response({"error": str(error)}, status=400)
+
+        body = json.dumps(page, default=json_default).encode()
+        headers = [
+            ("Content-Type", "application/json; charset=utf-8"),
+            ("Cache-Control", "no-store"),
+            ("Vary", "Accept-Encoding"),
+        ]
+        if (
+            len(body) >= GZIP_MIN_SIZE
+            and "gzip" in request.httprequest.accept_encodings
+        ):
+            body = gzip.compress(body, compresslevel=5)
+            headers.append(("Content-Encoding", "gzip"))
+        return request.make_response(body, headers)
+
+    @http.route(
+        "/mexi_it/export/requests.<string:file_format>",
+        type="http",
+        auth="user",
+        methods=["GET"],
+    )
+    def export_history(self, file_format, date_from=None, date_to=None):
+        """Stream the request history, archived requests included.
+
+        ``date_from`` and ``date_to`` (ISO dates, inclusive) filter on the
+        creation date. Rows are produced batch by batch from a server-side
+        cursor, so memory stays flat whatever the row count.
+        """
+        if file_format not in EXPORT_FORMATS:
+            return request.not_found()
+        domain = []
+        try:
+            if date_from:
+                domain.append(("create_date", ">=", self._parse_datetime(date_from)))
+            if date_to:
+                date_to = self._parse_datetime(date_to)
+                domain.append(("create_date", "<", date_to + timedelta(days=1)))
+        except ValueError as error:
+            return request.make_json_response({"error": str(error)}, status=400)
+
+        method, mimetype = EXPORT_FORMATS[file_format]
+        chunks = getattr(request.env["it.request"], method)(domain)
+        today = fields.Date.context_today(request.env.user)
+        filename = "it_requests_%s.%s" % (today, file_format)
+        return request.make_response(
+            chunks,
+            [
+                ("Content-Type", mimetype),
+                ("Content-Disposition", content_disposition(filename)),
+                ("Cache-Control", "no-store"),
+            ],
+        )
+
+    @staticmethod
+    def _parse_datetime(value):
+        value = datetime.fromisoformat(value)
+        if value.tzinfo:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
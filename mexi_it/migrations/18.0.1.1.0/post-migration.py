@@ -0,0 +1,28 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import SUPERUSER_ID, api
+
+
+def migrate(cr, version):
+    """Backfill ``state_entered_at`` from the best known state timestamp."""
+    cr.execute(
+        """
+        UPDATE it_request
+           SET state_entered_at = COALESCE(
+                   CASE state
+                       WHEN 'submitted' THEN submitted_date
+                       WHEN 'approved' THEN approved_date
+                       WHEN 'in_progress' THEN COALESCE(approved_date, submitted_date)
+                       WHEN 'done' THEN done_date
+                       WHEN 'rejected' THEN write_date
+                   END,
+                   create_date
+               )
+        """
+    )
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    requests = env["it.request"].search([])
+    requests.invalidate_recordset(["state_entered_at"])
+    requests.modified(["state_entered_at"])
+    requests.flush_recordset()
@@ -0,0 +1,18 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+
+def migrate(cr, version):
+    """Queue support requests still waiting for IT."""
+    cr.execute(
+        """
+        INSERT INTO it_request_queue
+               (request_id, priority, state, create_uid, create_date,
+                write_uid, write_date)
+        SELECT id, priority, 'open', 1, submitted_date, 1, submitted_date
+          FROM it_request
+         WHERE state = 'submitted'
+           AND request_type = 'support'
+            ON CONFLICT (request_id) DO NOTHING
+        """
+    )
@@ -0,0 +1,25 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+
+def migrate(cr, version):
+    """Backfill ``started_date`` from the chatter state tracking."""
+    cr.execute(
+        """
+        UPDATE it_request r
+           SET started_date = t.started
+          FROM (
+                SELECT m.res_id, MIN(m.date) AS started
+                  FROM mail_tracking_value v
+                  JOIN mail_message m ON m.id = v.mail_message_id
+                  JOIN ir_model_fields f ON f.id = v.field_id
+                 WHERE m.model = 'it.request'
+                   AND f.model = 'it.request'
+                   AND f.name = 'state'
+                   AND v.new_value_char IN ('In Progress', 'En Progreso')
+              GROUP BY m.res_id
+               ) t
+         WHERE t.res_id = r.id
+           AND r.started_date IS NULL
+        """
+    )
@@ -0,0 +1,21 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+
+def migrate(cr, version):
+    """Point the requester rule at the stored requester column.
+
+    The rule is declared in a noupdate block, so the update leaves it alone.
+    """
+    cr.execute(
+        """
+        UPDATE ir_rule
+           SET domain_force = '[("requester_user_id", "=", user.id)]'
+         WHERE id = (
+                SELECT res_id
+                  FROM ir_model_data
+                 WHERE module = 'mexi_it'
+                   AND name = 'rule_it_request_employee'
+               )
+        """
+    )
@@ -0,0 +1,29 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+
+def migrate(cr, version):
+    """Fill the denormalized employee columns with one query.
+
+    Creating the columns beforehand keeps the ORM from recomputing the new
+    stored related fields record by record during the update.
+    """
+    cr.execute(
+        """
+        ALTER TABLE it_request
+            ADD COLUMN IF NOT EXISTS requester_user_id int4,
+            ADD COLUMN IF NOT EXISTS department_id int4,
+            ADD COLUMN IF NOT EXISTS approver_user_id int4
+        """
+    )
+    cr.execute(
+        """
+        UPDATE it_request r
+           SET requester_user_id = e.user_id,
+               department_id = e.department_id,
+               approver_user_id = m.user_id
+          FROM hr_employee e
+     LEFT JOIN hr_employee m ON m.id = e.parent_id
+         WHERE e.id = r.employee_id
+        """
+    )
@@ -0,0 +1,55 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+
+def migrate(cr, version):
+    """Rebuild the state log of existing requests from their stamped dates.
+
+    Requests that went back to draft keep only their last pass through each
+    state, as the dates do. Rejections are dated from ``state_entered_at``,
+    the only stamp they have.
+    """
+    cr.execute(
+        """
+        INSERT INTO it_request_state_log
+               (request_id, from_state, to_state, user_id, date)
+        SELECT id, from_state, to_state, user_id, date
+          FROM (
+                SELECT r.id, NULL AS from_state, 'draft' AS to_state,
+                       r.create_uid AS user_id, r.create_date AS date
+                  FROM it_request r
+                 UNION ALL
+                SELECT r.id, 'draft', 'submitted', NULL, r.submitted_date
+                  FROM it_request r
+                 WHERE r.submitted_date IS NOT NULL
+                 UNION ALL
+                SELECT r.id, 'submitted', 'approved', r.approved_by_id,
+                       r.approved_date
+                  FROM it_request r
+                 WHERE r.approved_date IS NOT NULL
+                 UNION ALL
+                SELECT r.id, 'submitted', 'rejected', NULL, r.state_entered_at
+                  FROM it_request r
+                 WHERE r.state = 'rejected'
+                 UNION ALL
+                SELECT r.id,
+                       CASE WHEN r.approved_date IS NOT NULL THEN 'approved'
+                            ELSE 'submitted' END,
+                       'in_progress', r.assigned_it_user_id, r.started_date
+                  FROM it_request r
+                 WHERE r.started_date IS NOT NULL
+                 UNION ALL
+                SELECT r.id, 'in_progress', 'done', r.assigned_it_user_id,
+                       r.done_date
+                  FROM it_request r
+                 WHERE r.done_date IS NOT NULL
+               ) AS transitions
+         WHERE date IS NOT NULL
+           AND NOT EXISTS (
+                SELECT 1
+                  FROM it_request_state_log l
+                 WHERE l.request_id = transitions.id
+               )
+         ORDER BY date, id
+        """
+    )
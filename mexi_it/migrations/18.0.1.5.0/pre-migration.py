@@ -0,0 +1,23 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+
+def migrate(cr, version):
+    """Start the activity clock of existing requests at their last change.
+
+    Creating the column beforehand keeps the ORM from filling it with the
+    update date, which would hide every stale request for a full period.
+    """
+    cr.execute(
+        """
+        ALTER TABLE it_request
+            ADD COLUMN IF NOT EXISTS last_activity_at timestamp
+        """
+    )
+    cr.execute(
+        """
+        UPDATE it_request
+           SET last_activity_at = write_date
+         WHERE last_activity_at IS NULL
+        """
+    )
@@ -1 +1,16 @@
+from . import ir_websocket
 from . import it_request
+from . import it_request_api
+from . import it_request_digest
+from . import it_request_export
+from . import it_request_import
+from . import it_request_kanban
+from . import it_request_live
+from . import it_request_notification
+from . import it_request_profiling
+from . import it_request_queue
+from . import it_request_sla
+from . import it_request_state_log
+from . import it_request_technician_load
+from . import res_config_settings
+from . import res_users
@@ -0,0 +1,15 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import models
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = "ir.websocket"
+
+    def _build_bus_channel_list(self, channels):
+        """Subscribe IT request users to the live updates of their groups."""
+        if self.env.uid and not self.env.user._is_public():
+            channels = list(channels)
+            channels += self.env["it.request"]._get_live_update_user_channels()
+        return super()._build_bus_channel_list(channels)
@@ -1,8 +1,82 @@
 # Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
 # License OPL-1.0
 
+import textwrap
+from collections import defaultdict
+from datetime import timedelta
+
+from markupsafe import Markup, escape
+
 from odoo import _, api, fields, models
-from odoo.exceptions import UserError
+from odoo.exceptions import AccessError, UserError
+from odoo.tools import SQL, html2plaintext, split_every
+from odoo.tools.sql import create_index
+
+CLOSED_STATES = ("done", "rejected")
+# States in which the response / resolution SLA deadlines are running
+SLA_RESPONSE_STATES = ("submitted",)
+SLA_RESOLUTION_STATES = ("submitted", "approved", "in_progress")
+# States counted in the technician load used for auto-assignment
+ASSIGNMENT_LOAD_STATES = ("submitted", "in_progress")
+ASSIGNMENT_IMPACT_WEIGHTS = {"blocker": 2, "degraded": 1, "minor": 0}
+# Requests a technician can start: shared by claim_next and its partial index
+CLAIMABLE_CONDITION = (
+    "active AND ((request_type = 'support' AND state = 'submitted') "
+    "OR (request_type IN ('asset', 'software') AND state = 'approved'))"
+)
+# Fields shown by the kanban and list views, published live when written
+LIVE_UPDATE_FIELDS = {
+    "name",
+    "state",
+    "active",
+    "priority",
+    "request_type",
+    "employee_id",
+    "assigned_it_user_id",
+    "description",
+    "sla_resolution_deadline",
+}
+# Context key of scheduled actions: their writes are not activity on requests
+SYSTEM_WRITE_CONTEXT = "mexi_it_system_write"
+# Fields changing the kanban columns or who sees a request in them
+KANBAN_COUNT_FIELDS = {"state", "active", "assigned_it_user_id", "employee_id"}
+# Texts covered by the full-text index, stemmed in both UI languages
+FULLTEXT_FIELDS = ("description", "resolution", "software_name")
+FULLTEXT_CONFIGS = ("spanish", "english")
+# Resolved requests listed on the form, and how much of the request text
+# is turned into their query
+SIMILAR_LIMIT = 5
+SIMILAR_QUERY_CHARS = 300
+
+
+def fulltext_document(alias=""):
+    """Return the SQL of the tsvector indexed by ``it_request_fulltext_idx``.
+
+    Searches must repeat this exact expression for PostgreSQL to use the index.
+    """
+    prefix = '"%s".' % alias if alias else ""
+    text = " || ' ' || ".join(
+        "coalesce(%s\"%s\", '')" % (prefix, fname) for fname in FULLTEXT_FIELDS
+    )
+    return " || ".join(
+        "to_tsvector('%s'::regconfig, %s)" % (config, text)
+        for config in FULLTEXT_CONFIGS
+    )
+
+
+def sla_pending_condition(kind):
+    """Return the SQL condition of the requests whose ``kind`` SLA, response
+    or resolution, is running and not escalated yet."""
+    states = SLA_RESPONSE_STATES if kind == "response" else SLA_RESOLUTION_STATES
+    return "state IN (%s) AND sla_%s_escalated IS NOT TRUE" % (
+        ", ".join("'%s'" % state for state in states),
+        kind,
+    )
+
+
+def request_selection(field_name):
+    """Return a selection callable mirroring an ``it.request`` field."""
+    return lambda self: self.env["it.request"]._fields[field_name].selection
 
 
 class ItRequest(models.Model):
@@ -21,6 +95,7 @@ class ItRequest(models.Model):
     # -------------------------------------------------------------------------
     # Fields
     # -------------------------------------------------------------------------
+    active = fields.Boolean(default=True)
     name = fields.Char(
         string="Folio",
         required=True,
@@ -50,6 +125,7 @@ class ItRequest(models.Model):
         default="draft",
         required=True,
         tracking=True,
+        group_expand="_read_group_expand_state",
     )
     priority = fields.Selection(
         selection=[("0", "Low"), ("1", "Medium"), ("2", "High")],
@@ -63,14 +139,25 @@ class ItRequest(models.Model):
         comodel_name="hr.employee",
         string="Employee",
         required=True,
+        index=True,
         default=lambda self: self._default_employee_id(),
     )
+    # Stored copies of the employee's user, department and manager, so that
+    # record rules, filters and grouping stay on this table
+    requester_user_id = fields.Many2one(
+        comodel_name="res.users",
+        string="Requester User",
+        related="employee_id.user_id",
+        store=True,
+        index=True,
+    )
     department_id = fields.Many2one(
         comodel_name="hr.department",
         string="Department",
         related="employee_id.department_id",
         readonly=True,
-        store=False,
+        store=True,
+        index=True,
     )
     job_id = fields.Many2one(
         comodel_name="hr.job",
@@ -86,6 +173,13 @@ class ItRequest(models.Model):
         readonly=True,
         store=False,
     )
+    approver_user_id = fields.Many2one(
+        comodel_name="res.users",
+        string="Approver User",
+        related="employee_id.parent_id.user_id",
+        store=True,
+        index=True,
+    )
 
     # Request details
     description = fields.Text(string="Description")
@@ -176,7 +270,57 @@ class ItRequest(models.Model):
 
     # Timeline tracking
     submitted_date = fields.Datetime(string="Submitted Date", readonly=True)
+    started_date = fields.Datetime(string="Start Date", readonly=True)
     done_date = fields.Datetime(string="Completion Date", readonly=True)
+    state_entered_at = fields.Datetime(
+        string="State Since",
+        default=fields.Datetime.now,
+        readonly=True,
+        copy=False,
+        index=True,
+    )
+
+    state_log_ids = fields.One2many(
+        comodel_name="it.request.state.log",
+        inverse_name="request_id",
+        string="State History",
+        readonly=True,
+        groups="mexi_it.group_it_request_it,mexi_it.group_it_request_approver",
+    )
+
+    # Service level
+    sla_policy_id = fields.Many2one(
+        comodel_name="it.request.sla",
+        string="SLA Policy",
+        compute="_compute_sla",
+        store=True,
+    )
+    sla_response_deadline = fields.Datetime(
+        string="Response Deadline",
+        compute="_compute_sla",
+        store=True,
+    )
+    sla_resolution_deadline = fields.Datetime(
+        string="Resolution Deadline",
+        compute="_compute_sla",
+        store=True,
+    )
+    sla_response_escalated = fields.Boolean(
+        string="Response SLA Escalated", readonly=True, copy=False
+    )
+    sla_resolution_escalated = fields.Boolean(
+        string="Resolution SLA Escalated", readonly=True, copy=False
+    )
+    # Stale request follow-up: last change or comment made by a person, as
+    # opposed to write_date, which scheduled actions also move
+    last_activity_at = fields.Datetime(
+        string="Last Activity",
+        readonly=True,
+        copy=False,
+        default=fields.Datetime.now,
+    )
+    stale_reminded_at = fields.Datetime(readonly=True, copy=False)
+    stale_escalated_at = fields.Datetime(readonly=True, copy=False)
 
     # Equipment reference (computed)
     equipment_employee_ids = fields.Many2many(
@@ -193,21 +337,124 @@ class ItRequest(models.Model):
         readonly=True,
         store=False,
     )
+    equipment_employee_count = fields.Integer(
+        compute="_compute_equipment_counts",
+        string="Employee Equipment Count",
+    )
+    equipment_department_count = fields.Integer(
+        compute="_compute_equipment_counts",
+        string="Department Equipment Count",
+    )
+
+    # Full-text search
+    fulltext = fields.Char(
+        string="Texto",
+        compute="_compute_fulltext",
+        search="_search_fulltext",
+        help="Searches description, resolution and software name in Spanish "
+        "and English.",
+    )
+    similar_request_ids = fields.Many2many(
+        comodel_name="it.request",
+        compute="_compute_similar_request_ids",
+        string="Similar Resolved Requests",
+    )
 
     # Metrics for visual indicators
     days_since_creation = fields.Integer(
         compute="_compute_days_metrics",
         string="Days Since Creation",
+        store=True,
     )
     days_in_current_state = fields.Integer(
         compute="_compute_days_metrics",
         string="Days in Current State",
+        store=True,
     )
     color = fields.Integer(
         compute="_compute_color",
         string="Color Index",
+        store=True,
     )
 
+    # -------------------------------------------------------------------------
+    # Database
+    # -------------------------------------------------------------------------
+    def init(self):
+        # The search filters, the kanban grouping and the approver/IT record
+        # rules all combine state with request_type; active is appended so
+        # the per-state kanban counts can be answered from the index alone
+        create_index(
+            self.env.cr,
+            "it_request_state_type_idx",
+            self._table,
+            ["state", "request_type", "active"],
+        )
+        # Technician workload and "assigned to" lookups; unassigned requests
+        # are left out of the index
+        create_index(
+            self.env.cr,
+            "it_request_assigned_state_idx",
+            self._table,
+            ["assigned_it_user_id", "state"],
+            where="assigned_it_user_id IS NOT NULL",
+        )
+        # Partial indexes matching the escalation queries, so finding SLA
+        # breaches is a range scan over unescalated open requests only
+        create_index(
+            self.env.cr,
+            "it_request_sla_response_idx",
+            self._table,
+            ["sla_response_deadline"],
+            where=sla_pending_condition("response"),
+        )
+        create_index(
+            self.env.cr,
+            "it_request_sla_resolution_idx",
+            self._table,
+            ["sla_resolution_deadline"],
+            where=sla_pending_condition("resolution"),
+        )
+        # Stale request follow-up: drafts and requests in progress by age
+        create_index(
+            self.env.cr,
+            "it_request_stale_activity_idx",
+            self._table,
+            ["state", "last_activity_at"],
+            where="state IN ('draft', 'in_progress')",
+        )
+        # Archiving candidates: closed requests still active
+        create_index(
+            self.env.cr,
+            "it_request_archive_candidate_idx",
+            self._table,
+            ["state_entered_at"],
+            where="active AND state IN ('done', 'rejected')",
+        )
+        # Full-text search and the similar resolved requests of the form
+        create_index(
+            self.env.cr,
+            "it_request_fulltext_idx",
+            self._table,
+            ["(%s)" % fulltext_document()],
+            method="gin",
+        )
+        # "Pull next ticket": the claimable requests in claiming order
+        create_index(
+            self.env.cr,
+            "it_request_claimable_idx",
+            self._table,
+            ["priority DESC", "submitted_date", "id"],
+            where=CLAIMABLE_CONDITION,
+        )
+        # Keyset pagination of the JSON sync API
+        create_index(
+            self.env.cr,
+            "it_request_write_date_id_idx",
+            self._table,
+            ["write_date", "id"],
+        )
+
     # -------------------------------------------------------------------------
     # Defaults
     # -------------------------------------------------------------------------
@@ -223,48 +470,80 @@ class ItRequest(models.Model):
     # -------------------------------------------------------------------------
     @api.depends("employee_id")
     def _compute_equipment_employee_ids(self):
-        """Fetch equipment assigned to request employee."""
-        Equipment = self.env["maintenance.equipment"]
+        """Fetch equipment assigned to request employees in one query."""
+        equipment_map = self._get_equipment_map("employee_id", self.employee_id)
         for record in self:
-            if record.employee_id:
-                record.equipment_employee_ids = Equipment.search(
-                    [("employee_id", "=", record.employee_id.id)]
-                )
-            else:
-                record.equipment_employee_ids = Equipment.browse()
+            record.equipment_employee_ids = equipment_map.get(
+                record.employee_id.id, self.env["maintenance.equipment"]
+            )
 
-    @api.depends("employee_id")
+    @api.depends("employee_id.department_id")
     def _compute_equipment_department_ids(self):
-        """Fetch equipment assigned to employee's department."""
-        Equipment = self.env["maintenance.equipment"]
+        """Fetch equipment assigned to employee departments in one query."""
+        equipment_map = self._get_equipment_map(
+            "department_id", self.employee_id.department_id
+        )
         for record in self:
-            if record.employee_id.department_id:
-                record.equipment_department_ids = Equipment.search(
-                    [("department_id", "=", record.employee_id.department_id.id)]
-                )
-            else:
-                record.equipment_department_ids = Equipment.browse()
+            record.equipment_department_ids = equipment_map.get(
+                record.employee_id.department_id.id,
+                self.env["maintenance.equipment"],
+            )
+
+    @api.depends("employee_id.department_id")
+    def _compute_equipment_counts(self):
+        """Count the equipment of the employees and departments of ``self``,
+        with one grouped query per owner type."""
+        employee_counts = self._get_equipment_counts(
+            "employee_id", self.employee_id
+        )
+        department_counts = self._get_equipment_counts(
+            "department_id", self.employee_id.department_id
+        )
+        for record in self:
+            record.equipment_employee_count = employee_counts.get(
+                record.employee_id.id, 0
+            )
+            record.equipment_department_count = department_counts.get(
+                record.employee_id.department_id.id, 0
+            )
 
-    @api.depends("create_date", "submitted_date", "approved_date", "state")
+    def _get_equipment_map(self, groupby, owners):
+        """Return ``{owner id: equipment}`` grouped by ``groupby``."""
+        if not owners:
+            return {}
+        groups = self.env["maintenance.equipment"]._read_group(
+            [(groupby, "in", owners.ids)], [groupby], ["id:recordset"]
+        )
+        return {owner.id: equipment for owner, equipment in groups}
+
+    def _get_equipment_counts(self, groupby, owners):
+        """Return ``{owner id: equipment count}`` grouped by ``groupby``."""
+        if not owners:
+            return {}
+        groups = (
+            self.env["maintenance.equipment"]
+            .sudo()
+            ._read_group([(groupby, "in", owners.ids)], [groupby], ["__count"])
+        )
+        return {owner.id: count for owner, count in groups}
+
+    @api.depends("create_date", "state", "state_entered_at")
     def _compute_days_metrics(self):
-        """Calculate days since creation and in current state."""
+        """Calculate days since creation and in current state.
+
+        Values are stored and kept fresh by ``_cron_refresh_days_metrics``.
+        Aging stops once a request is done or rejected.
+        """
+        now = fields.Datetime.now()
         for record in self:
-            now = fields.Datetime.now()
-            if record.create_date:
-                delta = now - record.create_date
-                record.days_since_creation = delta.days
+            closed = record.state in CLOSED_STATES
+            end = record.state_entered_at if closed else now
+            if record.create_date and end:
+                record.days_since_creation = (end - record.create_date).days
             else:
                 record.days_since_creation = 0
-
-            state_date_map = {
-                "submitted": record.submitted_date,
-                "approved": record.approved_date,
-                "in_progress": record.approved_date or record.submitted_date,
-                "done": record.done_date,
-            }
-            state_date = state_date_map.get(record.state)
-            if state_date:
-                delta = now - state_date
+            if record.state_entered_at and not closed:
+                delta = now - record.state_entered_at
                 record.days_in_current_state = delta.days
             else:
                 record.days_in_current_state = 0
@@ -284,21 +563,179 @@ class ItRequest(models.Model):
             else:
                 record.color = 10
 
+    @api.depends("request_type", "priority", "support_impact", "submitted_date")
+    def _compute_sla(self):
+        """Stamp the SLA deadlines counted from submission."""
+        match = self.env["it.request.sla"].sudo()._get_policy_matcher()
+        for record in self:
+            policy = match(record)
+            record.sla_policy_id = policy
+            if policy and record.submitted_date:
+                (
+                    record.sla_response_deadline,
+                    record.sla_resolution_deadline,
+                ) = policy._get_deadlines(record.submitted_date)
+            else:
+                record.sla_response_deadline = False
+                record.sla_resolution_deadline = False
+
+    def _compute_fulltext(self):
+        self.fulltext = False
+
+    @api.depends("description", "software_name")
+    def _compute_similar_request_ids(self):
+        """Rank resolved requests against the text of each request."""
+        for record in self:
+            text = " ".join(filter(None, [record.description, record.software_name]))
+            if not text.strip():
+                record.similar_request_ids = False
+                continue
+            text = textwrap.shorten(text, SIMILAR_QUERY_CHARS, placeholder="")
+            record.similar_request_ids = self._search_fulltext_ranked(
+                self._fulltext_any_query(text),
+                [
+                    ("state", "=", "done"),
+                    ("resolution", "!=", False),
+                    ("id", "!=", record._origin.id),
+                ],
+                limit=SIMILAR_LIMIT,
+            )
+
+    # -------------------------------------------------------------------------
+    # Full-text Search
+    # -------------------------------------------------------------------------
+    @api.model
+    def search_fulltext(self, text, domain=None, limit=10):
+        """Return the requests matching ``text``, best ranked first.
+
+        ``text`` uses the web search syntax (``"phrase"``, ``or``, ``-word``)
+        and is matched in Spanish and English. Archived requests are included
+        unless ``domain`` excludes them; record rules apply as usual.
+        """
+        if not text or not text.strip():
+            return self.browse()
+        return self._search_fulltext_ranked(
+            self._fulltext_query("websearch_to_tsquery", text), domain, limit
+        )
+
+    @api.model
+    def _fulltext_query(self, function, text):
+        """Return the tsquery of ``text`` parsed by ``function`` per language."""
+        return SQL(" || ").join(
+            SQL("%s(%s::regconfig, %s)", SQL(function), config, text)
+            for config in FULLTEXT_CONFIGS
+        )
+
+    @api.model
+    def _fulltext_any_query(self, text):
+        """Return a tsquery matching any significant word of ``text``."""
+        # plainto_tsquery drops stop words and stems; its text form joins the
+        # lexemes with "&", turned into "|" so partial overlaps still rank
+        return SQL(" || ").join(
+            SQL(
+                "replace(plainto_tsquery(%s::regconfig, %s)::text, ' & ', ' | ')"
+                "::tsquery",
+                config,
+                text,
+            )
+            for config in FULLTEXT_CONFIGS
+        )
+
+    @api.model
+    def _search_fulltext_ranked(self, tsquery, domain=None, limit=None):
+        """Return the requests of ``domain`` matching ``tsquery`` by rank."""
+        Request = self.with_context(active_test=False)
+        query = Request._search(domain or [])
+        document = SQL(fulltext_document(self._table))
+        query.add_where(SQL("%s @@ %s", document, tsquery))
+        query.order = SQL(
+            "ts_rank_cd(%s, %s) DESC, %s DESC",
+            document,
+            tsquery,
+            SQL.identifier(self._table, "id"),
+        )
+        query.limit = limit
+        return self.browse(query.get_result_ids())
+
+    def _search_fulltext(self, operator, value):
+        if operator not in ("ilike", "=") or not isinstance(value, str):
+            raise UserError(_("Unsupported full-text search: %s") % operator)
+        if not value.strip():
+            return []
+        query = self.sudo().with_context(active_test=False)._search([])
+        query.add_where(
+            SQL(
+                "%s @@ %s",
+                SQL(fulltext_document(self._table)),
+                self._fulltext_query("websearch_to_tsquery", value),
+            )
+        )
+        return [("id", "in", query)]
+
     # -------------------------------------------------------------------------
     # CRUD
     # -------------------------------------------------------------------------
     @api.model_create_multi
     def create(self, vals_list):
         """Generate sequence and subscribe default followers."""
-        for vals in vals_list:
-            if vals.get("name", "New") == "New":
-                vals["name"] = (
-                    self.env["ir.sequence"].next_by_code("it.request") or "New"
-                )
+        unnumbered = [vals for vals in vals_list if vals.get("name", "New") == "New"]
+        for vals, folio in zip(unnumbered, self._reserve_folios(len(unnumbered))):
+            vals["name"] = folio
         records = super().create(vals_list)
         records._ensure_default_followers()
+        self.env["it.request.state.log"]._log_transitions(
+            records, {}, fields.Datetime.now()
+        )
+        self.env["it.request.technician.load"].sudo()._apply_load_change(
+            {}, records._get_technician_load()
+        )
+        records._queue_live_update()
+        self._bump_kanban_generation()
         return records
 
+    @api.model
+    def _reserve_folios(self, count):
+        """Return ``count`` new folios reserved with a single sequence call."""
+        if count <= 0:
+            return []
+        sequence = (
+            self.env["ir.sequence"]
+            .sudo()
+            .search(
+                [
+                    ("code", "=", "it.request"),
+                    ("company_id", "in", [self.env.company.id, False]),
+                ],
+                order="company_id",
+                limit=1,
+            )
+        )
+        if not sequence:
+            return ["New"] * count
+        if sequence.use_date_range:
+            return [sequence.next_by_id() for _i in range(count)]
+        if sequence.implementation == "standard":
+            self.env.cr.execute(
+                "SELECT nextval(%s) FROM generate_series(1, %s)",
+                ["ir_sequence_%03d" % sequence.id, count],
+            )
+            numbers = [row[0] for row in self.env.cr.fetchall()]
+        else:
+            step = sequence.number_increment
+            self.env.cr.execute(
+                """
+                UPDATE ir_sequence
+                   SET number_next = number_next + %s
+                 WHERE id = %s
+             RETURNING number_next
+                """,
+                [step * count, sequence.id],
+            )
+            number_next = self.env.cr.fetchone()[0]
+            numbers = range(number_next - step * count, number_next, step)
+            sequence.invalidate_recordset(["number_next"])
+        return [sequence.get_next_char(number) for number in numbers]
+
     def write(self, vals):
         """Block request field changes after draft state."""
         blocked_fields = {
@@ -321,85 +758,428 @@ class ItRequest(models.Model):
             record.state != "draft" for record in self
         ):
             raise UserError(_("Request details can only be modified in draft state."))
+        if "state" in vals and "state_entered_at" not in vals:
+            vals = dict(vals, state_entered_at=fields.Datetime.now())
+        if (
+            not self.env.context.get(SYSTEM_WRITE_CONTEXT)
+            and "last_activity_at" not in vals
+        ):
+            vals = dict(vals, last_activity_at=fields.Datetime.now())
+        track_load = not {
+            "state",
+            "assigned_it_user_id",
+            "priority",
+            "support_impact",
+        }.isdisjoint(vals)
+        if track_load:
+            load_before = self._get_technician_load()
+        if "state" in vals:
+            previous_states = {record.id: record.state for record in self}
+        published = LIVE_UPDATE_FIELDS.intersection(vals)
+        if published:
+            # Channels that could see the requests before the change
+            self._queue_live_update()
         result = super().write(vals)
+        if published:
+            self._queue_live_update()
+        if not KANBAN_COUNT_FIELDS.isdisjoint(vals):
+            self._bump_kanban_generation()
+        if "state" in vals:
+            self.env["it.request.state.log"]._log_transitions(
+                self, previous_states, vals["state_entered_at"]
+            )
         if "assigned_it_user_id" in vals:
             self._ensure_default_followers()
+        if vals.get("state", "submitted") != "submitted":
+            self.env["it.request.queue"].sudo().search(
+                [("request_id", "in", self.ids), ("state", "=", "open")]
+            ).write({"state": "closed"})
+        if track_load:
+            self.env["it.request.technician.load"].sudo()._apply_load_change(
+                load_before, self._get_technician_load()
+            )
         return result
 
+    def unlink(self):
+        """Release the technician load held by deleted requests."""
+        self._queue_live_update()
+        self._bump_kanban_generation()
+        load_before = self._get_technician_load()
+        result = super().unlink()
+        self.env["it.request.technician.load"].sudo()._apply_load_change(
+            load_before, {}
+        )
+        return result
+
+    # -------------------------------------------------------------------------
+    # Scheduled Actions
+    # -------------------------------------------------------------------------
+    @api.model
+    def _cron_refresh_days_metrics(self):
+        """Refresh stored aging metrics of open requests in a single query."""
+        self.flush_model(["create_date", "state", "state_entered_at"])
+        self.env.cr.execute(
+            """
+            WITH metrics AS (
+                SELECT id,
+                       COALESCE(EXTRACT(DAY FROM
+                           (NOW() AT TIME ZONE 'UTC') - create_date
+                       ), 0)::int AS since_creation,
+                       COALESCE(EXTRACT(DAY FROM
+                           (NOW() AT TIME ZONE 'UTC') - state_entered_at
+                       ), 0)::int AS in_state
+                  FROM it_request
+                 WHERE state NOT IN %s
+            )
+            UPDATE it_request r
+               SET days_since_creation = m.since_creation,
+                   days_in_current_state = m.in_state
+              FROM metrics m
+             WHERE r.id = m.id
+               AND (r.days_since_creation IS DISTINCT FROM m.since_creation
+                    OR r.days_in_current_state IS DISTINCT FROM m.in_state)
+         RETURNING r.id
+            """,
+            [CLOSED_STATES],
+        )
+        records = self.browse([row[0] for row in self.env.cr.fetchall()])
+        records.invalidate_recordset(["days_since_creation", "days_in_current_state"])
+        records.modified(["days_since_creation", "days_in_current_state"])
+        records.flush_recordset(["color"])
+
+    @api.model
+    def _cron_escalate_sla(self, batch_size=200):
+        """Escalate requests past their SLA deadlines, one batch at a time.
+
+        Each batch is a range query on the partial deadline indexes, so the
+        cost follows the number of breaches rather than of requests.
+        """
+        self = self.with_context(**{SYSTEM_WRITE_CONTEXT: True})
+        now = fields.Datetime.now()
+        for kind in ("response", "resolution"):
+            deadline = SQL.identifier("sla_%s_deadline" % kind)
+            query = SQL(
+                """
+                SELECT id
+                  FROM it_request
+                 WHERE %s
+                   AND %s < %s
+              ORDER BY %s
+                 LIMIT %s
+                """,
+                SQL(sla_pending_condition(kind)),
+                deadline,
+                now,
+                deadline,
+                batch_size,
+            )
+            while True:
+                self.flush_model()
+                self.env.cr.execute(query)
+                records = self.browse([row[0] for row in self.env.cr.fetchall()])
+                if not records:
+                    break
+                records._escalate_sla(kind)
+                if not self.env.registry.in_test_mode():
+                    self.env.cr.commit()
+
+    def _escalate_sla(self, kind):
+        """Apply the policy escalation for a missed ``kind`` deadline."""
+        self.write({"sla_%s_escalated" % kind: True})
+        for policy, records in self.grouped("sla_policy_id").items():
+            if policy.escalation_action == "priority":
+                for priority, to_raise in records.grouped("priority").items():
+                    if priority != "2":
+                        to_raise.write({"priority": str(int(priority) + 1)})
+            elif policy.escalation_action == "reassign":
+                if policy.escalation_user_id:
+                    records.write(
+                        {"assigned_it_user_id": policy.escalation_user_id.id}
+                    )
+                else:
+                    self.env["it.request.technician.load"].sudo()._assign_technicians(
+                        records
+                    )
+        if kind == "response":
+            body = _("⚠ Response time (SLA) exceeded")
+        else:
+            body = _("⚠ Resolution time (SLA) exceeded")
+        self._notify_status_change(body)
+
+    @api.model
+    def _cron_process_stale(self, batch_size=200):
+        """Close stale drafts, remind and escalate stale requests in progress.
+
+        Requests are selected on the age of their last human activity and
+        handled one batch per transaction. A handled request leaves the
+        selection (drafts are archived, requests in progress are stamped),
+        so a run stopped by the worker time limit resumes where it left off.
+        """
+        self = self.with_context(**{SYSTEM_WRITE_CONTEXT: True})
+        Param = self.env["ir.config_parameter"].sudo()
+        steps = [
+            (
+                "mexi_it.stale_draft_days",
+                30,
+                "_close_stale_drafts",
+                """
+                SELECT id
+                  FROM it_request
+                 WHERE state = 'draft'
+                   AND active
+                   AND last_activity_at < %s
+              ORDER BY last_activity_at
+                 LIMIT %s
+                """,
+            ),
+            (
+                "mexi_it.stale_remind_days",
+                7,
+                "_remind_stale",
+                """
+                SELECT id
+                  FROM it_request
+                 WHERE state = 'in_progress'
+                   AND last_activity_at < %s
+                   AND (stale_reminded_at IS NULL
+                        OR stale_reminded_at < last_activity_at)
+              ORDER BY last_activity_at
+                 LIMIT %s
+                """,
+            ),
+            (
+                "mexi_it.stale_escalate_days",
+                14,
+                "_escalate_stale",
+                """
+                SELECT id
+                  FROM it_request
+                 WHERE state = 'in_progress'
+                   AND last_activity_at < %s
+                   AND (stale_escalated_at IS NULL
+                        OR stale_escalated_at < last_activity_at)
+              ORDER BY last_activity_at
+                 LIMIT %s
+                """,
+            ),
+        ]
+        now = fields.Datetime.now()
+        for param, default, method, query in steps:
+            days = int(Param.get_param(param, default))
+            if days <= 0:
+                continue
+            cutoff = now - timedelta(days=days)
+            while True:
+                self.flush_model()
+                self.env.cr.execute(query, [cutoff, batch_size])
+                records = self.browse([row[0] for row in self.env.cr.fetchall()])
+                if not records:
+                    break
+                getattr(records, method)(days)
+                if not self.env.registry.in_test_mode():
+                    self.env.cr.commit()
+                self.env.invalidate_all()
+
+    def _close_stale_drafts(self, days):
+        """Archive drafts left unsubmitted for ``days`` days, with a note."""
+        note = _("Archived automatically: not submitted in %s days.") % days
+        self._message_log_batch(bodies={record.id: note for record in self})
+        self.write({"active": False})
+
+    def _remind_stale(self, days):
+        """Ask the technicians of requests untouched for ``days`` days."""
+        note = _("No progress for %s days: update or close the request.") % days
+        self._schedule_todo_activities(
+            [
+                (record, record.assigned_it_user_id, note)
+                for record in self
+                if record.assigned_it_user_id
+            ]
+        )
+        self.write({"stale_reminded_at": fields.Datetime.now()})
+
+    def _escalate_stale(self, days):
+        """Notify everyone involved in requests untouched for ``days`` days."""
+        body = _("⚠ No progress for %s days") % days
+        self._schedule_todo_activities(
+            [
+                (record, record.assigned_it_user_id, body)
+                for record in self
+                if record.assigned_it_user_id
+            ]
+        )
+        self._notify_status_change(body)
+        self.write({"stale_escalated_at": fields.Datetime.now()})
+
+    @api.model
+    def _cron_archive_closed(self, batch_size=500):
+        """Archive requests closed for longer than the retention period.
+
+        Each batch has its chatter compacted into one summary note and is
+        committed on its own; archived requests remain available through
+        the "Archivadas" filter.
+        """
+        self = self.with_context(**{SYSTEM_WRITE_CONTEXT: True})
+        days = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("mexi_it.archive_after_days", 365)
+        )
+        if days <= 0:
+            return
+        cutoff = fields.Datetime.now() - timedelta(days=days)
+        while True:
+            records = self.search(
+                [
+                    ("active", "=", True),
+                    ("state", "in", CLOSED_STATES),
+                    ("state_entered_at", "<", cutoff),
+                ],
+                order="state_entered_at",
+                limit=batch_size,
+            )
+            if not records:
+                break
+            records._compact_chatter()
+            records.write({"active": False})
+            if not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            self.env.invalidate_all()
+
+    def _compact_chatter(self, chunk_size=1000):
+        """Replace the chatter of the requests by a single summary note.
+
+        Deleting the messages also removes their notifications and tracking
+        values; attachments stay linked to the request.
+        """
+        messages = (
+            self.env["mail.message"]
+            .sudo()
+            .search(
+                [("model", "=", self._name), ("res_id", "in", self.ids)],
+                order="date, id",
+            )
+        )
+        if not messages:
+            return
+        lines = defaultdict(list)
+        for message in messages:
+            text = textwrap.shorten(
+                html2plaintext(message.body or ""), 200, placeholder="…"
+            )
+            changes = [
+                "%s: %s → %s"
+                % (
+                    tracking.field_id.field_description,
+                    tracking.old_value_char or "",
+                    tracking.new_value_char or "",
+                )
+                for tracking in message.tracking_value_ids
+            ]
+            lines[message.res_id].append(
+                "%s — %s: %s"
+                % (
+                    fields.Datetime.to_string(message.date),
+                    message.author_id.name or message.email_from or "",
+                    "; ".join(filter(None, [text, *changes])),
+                )
+            )
+        bodies = {
+            record_id: Markup("<p>%s</p><ul>%s</ul>")
+            % (
+                _("Archived history (%s messages)") % len(record_lines),
+                Markup().join(
+                    Markup("<li>%s</li>") % escape(line) for line in record_lines
+                ),
+            )
+            for record_id, record_lines in lines.items()
+        }
+        for ids in split_every(chunk_size, messages.ids):
+            messages.browse(ids).unlink()
+        self.browse(list(bodies))._message_log_batch(bodies=bodies)
+
     # -------------------------------------------------------------------------
     # State Transition Actions
     # -------------------------------------------------------------------------
     def action_submit(self):
-        """Submit request for approval or direct IT assignment."""
+        """Submit requests for approval or direct IT assignment."""
         for record in self:
             if record.state != "draft":
                 raise UserError(_("Only draft requests can be submitted."))
             if not record.description:
                 raise UserError(_("Description is required to submit."))
             record._validate_request_type()
-            record.write(
-                {
-                    "state": "submitted",
-                    "submitted_date": fields.Datetime.now(),
-                }
-            )
-            record._notify_status_change(_("→ Submitted by %s") % record.employee_id.name)
+        self.write(
+            {
+                "state": "submitted",
+                "submitted_date": fields.Datetime.now(),
+            }
+        )
 
-            if record.request_type in ("asset", "software") and record.manager_id.user_id:
-                record.activity_schedule(
-                    "mail.mail_activity_data_todo",
-                    user_id=record.manager_id.user_id.id,
-                    note=_("Please review and approve request %s") % record.name,
-                )
-            elif record.request_type == "support":
-                it_group = self.env.ref(
-                    "mexi_it.group_it_request_it", raise_if_not_found=False
+        activities = []
+        for record in self:
+            if record.request_type in ("asset", "software") and record.approver_user_id:
+                activities.append(
+                    (
+                        record,
+                        record.approver_user_id,
+                        _("Please review and approve request %s") % record.name,
+                    )
                 )
-                if it_group and it_group.users:
-                    # Auto-assign first IT user if not assigned
-                    if not record.assigned_it_user_id:
-                        record.assigned_it_user_id = it_group.users[0]
-                    # Create activity for all IT group members
-                    for it_user in it_group.users:
-                        record.activity_schedule(
-                            "mail.mail_activity_data_todo",
-                            user_id=it_user.id,
-                            note=_("Support request %s needs attention") % record.name,
-                        )
+        support = self.filtered(lambda r: r.request_type == "support")
+        if support:
+            self.env["it.request.technician.load"].sudo()._assign_technicians(
+                support.filtered(lambda r: not r.assigned_it_user_id)
+            )
+            # A single shared queue entry instead of one activity per IT user
+            self.env["it.request.queue"].sudo().create(
+                [{"request_id": record.id} for record in support]
+            )
+        self._schedule_todo_activities(activities)
+        self._notify_status_change(
+            lambda record: _("→ Submitted by %s") % record.employee_id.name
+        )
 
     def action_approve(self):
-        """Approve request and assign IT activity."""
+        """Approve requests and assign IT activities."""
         for record in self:
             if record.state != "submitted":
                 raise UserError(_("Only submitted requests can be approved."))
             if record.request_type not in ("asset", "software"):
                 raise UserError(_("Only asset or software requests can be approved."))
-            record.write(
-                {
-                    "state": "approved",
-                    "approved_by_id": self.env.user.id,
-                    "approved_date": fields.Datetime.now(),
-                }
-            )
-            if self.env.user.partner_id:
-                record.message_subscribe(partner_ids=[self.env.user.partner_id.id])
-            record._notify_status_change(_("→ Approved by %s") % self.env.user.name)
+        self.write(
+            {
+                "state": "approved",
+                "approved_by_id": self.env.user.id,
+                "approved_date": fields.Datetime.now(),
+            }
+        )
+        if self.env.user.partner_id:
+            self.message_subscribe(partner_ids=[self.env.user.partner_id.id])
+        self._notify_status_change(_("→ Approved by %s") % self.env.user.name)
 
+        activities = []
+        for record in self:
             if record.assigned_it_user_id:
-                record.activity_schedule(
-                    "mail.mail_activity_data_todo",
-                    user_id=record.assigned_it_user_id.id,
-                    note=_("Work on approved request %s") % record.name,
+                activities.append(
+                    (
+                        record,
+                        record.assigned_it_user_id,
+                        _("Work on approved request %s") % record.name,
+                    )
                 )
             else:
-                record.activity_schedule(
-                    "mail.mail_activity_data_todo",
-                    user_id=self.env.user.id,
-                    note=_("Assign an IT technician to request %s") % record.name,
+                activities.append(
+                    (
+                        record,
+                        self.env.user,
+                        _("Assign an IT technician to request %s") % record.name,
+                    )
                 )
+        self._schedule_todo_activities(activities)
 
     def action_reject(self):
-        """Reject request with reason."""
+        """Reject requests with reason."""
         for record in self:
             if record.state != "submitted":
                 raise UserError(_("Only submitted requests can be rejected."))
@@ -407,14 +1187,14 @@ class ItRequest(models.Model):
                 raise UserError(_("Only asset or software requests can be rejected."))
             if not record.reject_reason:
                 raise UserError(_("Reject reason is required."))
-            record.write({"state": "rejected"})
-            record._notify_status_change(
-                _("→ Rejected by %s. Reason: %s")
-                % (self.env.user.name, record.reject_reason)
-            )
+        self.write({"state": "rejected"})
+        self._notify_status_change(
+            lambda record: _("→ Rejected by %s. Reason: %s")
+            % (self.env.user.name, record.reject_reason)
+        )
 
     def action_start(self):
-        """Start work on request."""
+        """Start work on requests."""
         for record in self:
             if record.request_type == "support":
                 if record.state != "submitted":
@@ -426,23 +1206,102 @@ class ItRequest(models.Model):
                     )
             if not record.assigned_it_user_id:
                 raise UserError(_("Please assign an IT user before starting work."))
-            record.write({"state": "in_progress"})
-            record._notify_status_change(
-                _("→ Work started by %s") % record.assigned_it_user_id.name
-            )
+        self.write({"state": "in_progress", "started_date": fields.Datetime.now()})
+        self._notify_status_change(
+            lambda record: _("→ Work started by %s") % record.assigned_it_user_id.name
+        )
 
     def action_done(self):
-        """Complete request with resolution."""
+        """Complete requests with resolution."""
         for record in self:
             if record.state != "in_progress":
                 raise UserError(_("Only in-progress requests can be done."))
             if not record.resolution:
                 raise UserError(_("Resolution is required to finish."))
-            record.write({"state": "done", "done_date": fields.Datetime.now()})
-            record._notify_status_change(
-                _("→ Completed by %s. Resolution: %s")
-                % (self.env.user.name, record.resolution)
+        self.write({"state": "done", "done_date": fields.Datetime.now()})
+        self._notify_status_change(
+            lambda record: _("→ Completed by %s. Resolution: %s")
+            % (self.env.user.name, record.resolution)
+        )
+
+    def action_claim(self):
+        """Take submitted support requests from the shared IT queue."""
+        entries = (
+            self.env["it.request.queue"]
+            .sudo()
+            .search([("request_id", "in", self.ids), ("state", "=", "open")])
+        )
+        if len(entries) != len(self):
+            raise UserError(_("Only queued support requests can be claimed."))
+        entries.with_user(self.env.user).action_claim()
+
+    @api.model
+    def claim_next(self):
+        """Assign the next claimable request to the current user and start it.
+
+        The highest priority, oldest request that is unassigned or already
+        assigned to the user is locked with SKIP LOCKED, so technicians
+        pulling at the same time each get a different request instead of
+        waiting on or overwriting each other.
+        """
+        if not self.env.user.has_group("mexi_it.group_it_request_it"):
+            raise AccessError(_("Only IT users can claim requests."))
+        self.flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT id
+                  FROM it_request
+                 WHERE %s
+                   AND (assigned_it_user_id IS NULL
+                        OR assigned_it_user_id = %s)
+              ORDER BY priority DESC, submitted_date, id
+                 LIMIT 1
+                   FOR UPDATE SKIP LOCKED
+                """,
+                SQL(CLAIMABLE_CONDITION),
+                self.env.uid,
             )
+        )
+        row = self.env.cr.fetchone()
+        if not row:
+            return {
+                "type": "ir.actions.client",
+                "tag": "display_notification",
+                "params": {
+                    "message": _("There are no requests waiting for IT."),
+                    "type": "info",
+                },
+            }
+        record = self.browse(row[0])
+        # Close its queue entry, if any, as action_claim of the queue does
+        self.env["it.request.queue"].flush_model()
+        now = fields.Datetime.now()
+        self.env.cr.execute(
+            """
+            UPDATE it_request_queue
+               SET state = 'claimed',
+                   claimed_by_id = %s,
+                   claimed_date = %s,
+                   write_uid = %s,
+                   write_date = %s
+             WHERE request_id = %s
+               AND state = 'open'
+            """,
+            [self.env.uid, now, self.env.uid, now, record.id],
+        )
+        self.env["it.request.queue"].invalidate_model(
+            ["state", "claimed_by_id", "claimed_date"]
+        )
+        record.write({"assigned_it_user_id": self.env.uid})
+        record.action_start()
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": self._name,
+            "res_id": record.id,
+            "view_mode": "form",
+            "views": [(False, "form")],
+        }
 
     # -------------------------------------------------------------------------
     # Validation
@@ -507,31 +1366,144 @@ class ItRequest(models.Model):
     # -------------------------------------------------------------------------
     # Notification System
     # -------------------------------------------------------------------------
-    def _collect_notification_partners(self):
-        """Collect all partners to notify: employee, manager, approver, IT."""
-        partners = self.env["res.partner"]
-        for record in self:
-            if record.employee_id.user_id.partner_id:
-                partners |= record.employee_id.user_id.partner_id
-            if record.manager_id.user_id.partner_id:
-                partners |= record.manager_id.user_id.partner_id
-            if record.approved_by_id.partner_id:
-                partners |= record.approved_by_id.partner_id
-            if record.assigned_it_user_id.partner_id:
-                partners |= record.assigned_it_user_id.partner_id
-        return partners
+    def _get_notification_partner_map(self):
+        """Return ``{request id: partner ids}`` of the parties to notify.
+
+        Resolutions are memoized for the current transaction, keyed on the
+        request and on the fields the recipients derive from, so repeated
+        calls during a transition cost nothing while a new approver or
+        assignee is picked up immediately.
+        """
+        cache = self.env.cr.precommit.data.setdefault(
+            "mexi_it.notification_partners", {}
+        )
+        keys = {
+            record.id: (
+                record.id,
+                record.requester_user_id.id,
+                record.approver_user_id.id,
+                record.approved_by_id.id,
+                record.assigned_it_user_id.id,
+            )
+            for record in self
+        }
+        missing = self.filtered(lambda r: keys[r.id] not in cache)
+        if missing:
+            # Prefetch every partner chain of the batch at once
+            missing.mapped("requester_user_id.partner_id")
+            missing.mapped("approver_user_id.partner_id")
+            missing.mapped("approved_by_id.partner_id")
+            missing.mapped("assigned_it_user_id.partner_id")
+            for record in missing:
+                partners = (
+                    record.requester_user_id.partner_id
+                    | record.approver_user_id.partner_id
+                    | record.approved_by_id.partner_id
+                    | record.assigned_it_user_id.partner_id
+                )
+                cache[keys[record.id]] = tuple(partners.ids)
+        return {record_id: cache[key] for record_id, key in keys.items()}
+
+    def _get_follower_partner_map(self, subtype=None):
+        """Return ``{request id: set of follower partner ids}``.
+
+        :param subtype: only keep the followers subscribed to this subtype
+        """
+        followers = {record_id: set() for record_id in self.ids}
+        domain = [("res_model", "=", self._name), ("res_id", "in", self.ids)]
+        if subtype:
+            domain.append(("subtype_ids", "in", subtype.ids))
+        for follower in self.env["mail.followers"].sudo().search_fetch(
+            domain, ["res_id", "partner_id"]
+        ):
+            if follower.partner_id:
+                followers[follower.res_id].add(follower.partner_id.id)
+        return followers
 
     def _ensure_default_followers(self):
-        """Subscribe relevant partners to chatter notifications."""
-        partners = self._collect_notification_partners()
-        if partners:
-            self.message_subscribe(partner_ids=partners.ids)
+        """Subscribe relevant partners that do not follow the requests yet."""
+        partner_map = self._get_notification_partner_map()
+        followers = self._get_follower_partner_map()
+        to_subscribe = defaultdict(list)
+        for record in self:
+            missing = tuple(
+                partner_id
+                for partner_id in partner_map[record.id]
+                if partner_id not in followers[record.id]
+            )
+            if missing:
+                to_subscribe[missing].append(record.id)
+        for partner_ids, record_ids in to_subscribe.items():
+            self.browse(record_ids).message_subscribe(partner_ids=list(partner_ids))
 
     def _notify_status_change(self, body):
-        """Post chatter message and notify followers."""
-        partners = self._collect_notification_partners()
-        self.message_post(
-            body=body,
-            partner_ids=partners.ids,
-            subtype_xmlid="mail.mt_comment",
+        """Queue the chatter message and notifications of a status change.
+
+        The message is posted and the followers and involved parties are
+        notified by the dispatch job, see ``it.request.notification``.
+
+        :param body: message body, or a callable returning the body for a
+            given record when it differs per request
+        """
+        self.env["it.request.notification"]._enqueue(self, body)
+
+    def _message_post_after_hook(self, message, msg_vals):
+        # Comments count as activity on the request
+        if message.message_type == "comment" and not self.env.context.get(
+            SYSTEM_WRITE_CONTEXT
+        ):
+            self.sudo().write({"last_activity_at": fields.Datetime.now()})
+        return super()._message_post_after_hook(message, msg_vals)
+
+    # -------------------------------------------------------------------------
+    # Assignment
+    # -------------------------------------------------------------------------
+    @api.model
+    def _get_assignment_weight_for(self, priority, support_impact):
+        """Return the load weight of a request with the given urgency."""
+        impact_weight = ASSIGNMENT_IMPACT_WEIGHTS.get(support_impact, 0)
+        return 1 + int(priority or 0) + impact_weight
+
+    def _get_assignment_weight(self):
+        """Return the load weight of this request."""
+        self.ensure_one()
+        return self._get_assignment_weight_for(self.priority, self.support_impact)
+
+    def _get_technician_load(self):
+        """Return ``{user id: [load, count]}`` held by these requests."""
+        load = defaultdict(lambda: [0, 0])
+        for record in self:
+            if record.state in ASSIGNMENT_LOAD_STATES and record.assigned_it_user_id:
+                entry = load[record.assigned_it_user_id.id]
+                entry[0] += record._get_assignment_weight()
+                entry[1] += 1
+        return load
+
+    # -------------------------------------------------------------------------
+    # Activities
+    # -------------------------------------------------------------------------
+    def _schedule_todo_activities(self, activities):
+        """Create to-do activities for many requests in one batch.
+
+        :param activities: list of ``(record, user, note)`` tuples
+        """
+        if not activities:
+            return self.env["mail.activity"]
+        activity_type = self.env.ref("mail.mail_activity_data_todo")
+        model_id = self.env["ir.model"]._get_id(self._name)
+        date_deadline = activity_type._get_date_deadline()
+        return self.env["mail.activity"].create(
+            [
+                {
+                    "res_model_id": model_id,
+                    "res_id": record.id,
+                    "activity_type_id": activity_type.id,
+                    "summary": activity_type.summary,
+                    "note": note,
+                    "user_id": user.id,
+                    "date_deadline": date_deadline,
+                    "automated": True,
+                }
+                for record, user, note in activities
+            ]
         )
@@ -0,0 +1,121 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from datetime import datetime
+
+from odoo import _, api, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+
+SYNC_DEFAULT_FIELDS = (
+    "name",
+    "request_type",
+    "state",
+    "priority",
+    "active",
+    "employee_id",
+    "department_id",
+    "assigned_it_user_id",
+    "submitted_date",
+    "approved_date",
+    "started_date",
+    "done_date",
+    "create_date",
+    "write_date",
+)
+SYNC_DEFAULT_LIMIT = 500
+SYNC_MAX_LIMIT = 5000
+# Rows written less than this long ago are held back: a transaction still
+# running stamps write_date with its start time, and would otherwise commit
+# behind a cursor already handed out
+SYNC_LAG_SECONDS = 60
+
+
+class ItRequest(models.Model):
+    """Incremental sync of requests for external pollers.
+
+    Pages are ordered on ``(write_date, id)`` and continue after the last
+    row of the previous page, so each poll reads only rows changed since
+    then through the ``(write_date, id)`` index, whatever the history size.
+    """
+
+    _inherit = "it.request"
+
+    @api.model
+    def _get_sync_page(self, cursor=None, since=None, fields=None, limit=None):
+        """Return a page of requests changed after ``cursor`` or ``since``.
+
+        :param cursor: ``next_cursor`` of the previous page
+        :param since: datetime to start from when there is no cursor
+        :param fields: names of the stored fields to return
+        :param limit: page size, at most ``SYNC_MAX_LIMIT``
+        :return: ``{"records", "next_cursor", "has_more"}``; ``next_cursor``
+            is the cursor to poll with next time, even when the page is empty
+
+        Deleted requests leave no row behind and are never returned: pollers
+        only see archiving, through ``active``, and must reconcile deletions
+        themselves.
+        """
+        fields = self._check_sync_fields(fields or SYNC_DEFAULT_FIELDS)
+        if limit is None:
+            limit = SYNC_DEFAULT_LIMIT
+        elif limit <= 0:
+            raise UserError(_("The limit must be a positive number."))
+        limit = min(limit, SYNC_MAX_LIMIT)
+        if cursor:
+            after = self._parse_sync_cursor(cursor)
+        elif since:
+            after = (since, 0)
+        else:
+            after = None
+
+        Request = self.with_context(active_test=False)
+        query = Request._search([], order="write_date, id", limit=limit + 1)
+        write_date = SQL.identifier(self._table, "write_date")
+        record_id = SQL.identifier(self._table, "id")
+        query.add_where(
+            SQL(
+                "%s < (now() AT TIME ZONE 'UTC') - make_interval(secs => %s)",
+                write_date,
+                SYNC_LAG_SECONDS,
+            )
+        )
+        if after:
+            query.add_where(SQL("(%s, %s) > (%s, %s)", write_date, record_id, *after))
+        self.env.cr.execute(query.select(record_id, write_date))
+        rows = self.env.cr.fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        records = Request.browse(row[0] for row in rows)
+        if rows:
+            last_id, last_write_date = rows[-1]
+            next_cursor = "%s_%s" % (last_write_date.isoformat(), last_id)
+        else:
+            next_cursor = cursor or ("%s_0" % since.isoformat() if since else None)
+        return {
+            "records": records.read(fields) if records else [],
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+
+    @api.model
+    def _check_sync_fields(self, fields):
+        unknown = [
+            fname
+            for fname in fields
+            if fname not in self._fields
+            or not self._fields[fname].store
+            or self._fields[fname].type == "binary"
+        ]
+        if unknown:
+            raise UserError(_("Unknown or unsupported fields: %s") % ", ".join(unknown))
+        return ["id", *dict.fromkeys(fname for fname in fields if fname != "id")]
+
+    @api.model
+    def _parse_sync_cursor(self, cursor):
+        try:
+            write_date, record_id = cursor.rsplit("_", 1)
+            return datetime.fromisoformat(write_date), int(record_id)
+        except ValueError:
+            raise UserError(_("Invalid cursor: %s") % cursor) from None
@@ -0,0 +1,103 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from collections import defaultdict
+
+from odoo import Command, api, fields, models
+
+
+class ItRequestDigest(models.Model):
+    """Status change waiting for the next digest of its recipient.
+
+    Filled by the notification dispatcher for users who chose an hourly or
+    daily digest, and emptied by one scheduled pass per window that sends a
+    single mail or inbox message per recipient.
+    """
+
+    _name = "it.request.digest"
+    _description = "IT Request Digest Entry"
+    _order = "date, id"
+    _log_access = False
+
+    partner_id = fields.Many2one(
+        comodel_name="res.partner",
+        string="Recipient",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    request_id = fields.Many2one(
+        comodel_name="it.request",
+        string="Request",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    body = fields.Text(required=True)
+    date = fields.Datetime(required=True)
+
+    @api.model
+    def _cron_send(self, frequencies, batch_size=200):
+        """Send the digests of recipients whose preference is in ``frequencies``.
+
+        Recipients who went back to immediate notifications are flushed by
+        the hourly pass. Every batch of recipients is committed on its own.
+        """
+        while True:
+            self.env.cr.execute(
+                """
+                SELECT DISTINCT d.partner_id
+                  FROM it_request_digest d
+             LEFT JOIN res_users u ON u.partner_id = d.partner_id
+                 WHERE COALESCE(u.it_request_digest, 'immediate') IN %s
+                 ORDER BY d.partner_id
+                 LIMIT %s
+                """,
+                [tuple(frequencies), batch_size],
+            )
+            partner_ids = [row[0] for row in self.env.cr.fetchall()]
+            if not partner_ids:
+                break
+            entries = self.search([("partner_id", "in", partner_ids)])
+            entries._send()
+            entries.unlink()
+            if not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            self.env.invalidate_all()
+
+    def _send(self):
+        """Send one digest per recipient of these entries."""
+        Notification = self.env["it.request.notification"]
+        entries = defaultdict(list)
+        for entry in self:
+            entries[entry.partner_id].append(entry)
+        mails = []
+        messages = []
+        for partner, partner_entries in entries.items():
+            lines = [
+                Notification._prepare_line(entry.request_id, entry.body, entry.date)
+                for entry in partner_entries
+            ]
+            user = partner.user_ids[:1]
+            if user and user.notification_type == "inbox":
+                subject, body = Notification._render_lines(partner, lines)
+                messages.append(
+                    {
+                        "subject": subject,
+                        "body": body,
+                        "message_type": "user_notification",
+                        "partner_ids": [Command.link(partner.id)],
+                        "notification_ids": [
+                            Command.create(
+                                {
+                                    "res_partner_id": partner.id,
+                                    "notification_type": "inbox",
+                                }
+                            )
+                        ],
+                    }
+                )
+            elif partner.email:
+                mails.append(Notification._prepare_mail(partner, lines))
+        self.env["mail.message"].sudo().create(messages)
+        self.env["mail.mail"].sudo().create(mails)
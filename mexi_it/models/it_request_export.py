@@ -0,0 +1,198 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import csv
+import io
+import tempfile
+
+import xlsxwriter
+
+from odoo import _, api, models
+from odoo.tools import SQL
+
+EXPORT_BATCH_SIZE = 2000
+EXPORT_CURSOR = "it_request_history_export"
+# Rows per worksheet, the XLSX limit minus the header
+XLSX_SHEET_ROWS = 1_048_575
+XLSX_CHUNK_SIZE = 64 * 1024
+
+
+class ItRequest(models.Model):
+    """Bounded-memory export of the request history for audits.
+
+    The query is built with the caller's record rules, then read in batches
+    through a server-side cursor on a dedicated read-only connection, so the
+    rows can be streamed after the HTTP request transaction has ended and
+    only one batch is held in memory at a time.
+    """
+
+    _inherit = "it.request"
+
+    @api.model
+    def _get_history_export_headers(self):
+        return [
+            _("Reference"),
+            _("Type"),
+            _("State"),
+            _("Priority"),
+            _("Employee"),
+            _("Department"),
+            _("Technician"),
+            _("Created on (UTC)"),
+            _("Submitted on (UTC)"),
+            _("Approved on (UTC)"),
+            _("Approved by"),
+            _("Started on (UTC)"),
+            _("Done on (UTC)"),
+            _("Archived"),
+        ]
+
+    @api.model
+    def _get_history_export_query(self, domain=None):
+        """Return the SQL selecting the export rows of ``domain``."""
+        ids = self.with_context(active_test=False)._search(domain or [])
+        Employee = self.env["hr.employee"]
+        Department = self.env["hr.department"]
+        Partner = self.env["res.partner"]
+        return SQL(
+            """
+            SELECT r.name, r.request_type, r.state, r.priority,
+                   %(employee)s, %(department)s, %(technician)s,
+                   r.create_date, r.submitted_date, r.approved_date,
+                   %(approver)s, r.started_date, r.done_date, NOT r.active
+              FROM it_request r
+              LEFT JOIN hr_employee e ON e.id = r.employee_id
+              LEFT JOIN hr_department d ON d.id = r.department_id
+              LEFT JOIN res_users tu ON tu.id = r.assigned_it_user_id
+              LEFT JOIN res_partner tp ON tp.id = tu.partner_id
+              LEFT JOIN res_users au ON au.id = r.approved_by_id
+              LEFT JOIN res_partner ap ON ap.id = au.partner_id
+             WHERE r.id IN (%(ids)s)
+             ORDER BY r.id
+            """,
+            employee=Employee._field_to_sql("e", "name"),
+            department=Department._field_to_sql("d", "name"),
+            technician=Partner._field_to_sql("tp", "name"),
+            approver=Partner._field_to_sql("ap", "name"),
+            ids=ids.subselect(),
+        )
+
+    @api.model
+    def _iter_history_export(self, domain=None):
+        """Return a generator of batches of export rows of ``domain``.
+
+        Selection keys are replaced by their labels in the user's language.
+        The generator opens its own cursor and can outlive this transaction.
+        """
+        query = self._get_history_export_query(domain)
+        labels = [
+            dict(self._fields[fname]._description_selection(self.env))
+            for fname in ("request_type", "state", "priority")
+        ]
+        registry = self.env.registry
+
+        def batches():
+            with registry.cursor(readonly=True) as cr:
+                cr.execute(
+                    SQL(
+                        "DECLARE %s NO SCROLL CURSOR FOR %s",
+                        SQL.identifier(EXPORT_CURSOR),
+                        query,
+                    )
+                )
+                while True:
+                    cr.execute(
+                        SQL(
+                            "FETCH FORWARD %s FROM %s",
+                            EXPORT_BATCH_SIZE,
+                            SQL.identifier(EXPORT_CURSOR),
+                        )
+                    )
+                    rows = cr.fetchall()
+                    if not rows:
+                        break
+                    yield [
+                        (
+                            row[0],
+                            *(
+                                selection.get(value, value)
+                                for selection, value in zip(labels, row[1:4])
+                            ),
+                            *row[4:],
+                        )
+                        for row in rows
+                    ]
+
+        return batches()
+
+    # -------------------------------------------------------------------------
+    # File formats
+    # -------------------------------------------------------------------------
+    @api.model
+    def _stream_history_csv(self, domain=None):
+        """Yield the CSV export of ``domain`` as UTF-8 chunks, one per batch."""
+        headers = self._get_history_export_headers()
+        batches = self._iter_history_export(domain)
+
+        def chunks():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            # BOM so spreadsheet applications detect the encoding
+            buffer.write("\ufeff")
+            writer.writerow(headers)
+            for rows in batches:
+                writer.writerows(
+                    [value or "" for value in row[:-1]] + [row[-1] and "x" or ""]
+                    for row in rows
+                )
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            # Header only, when there is no row
+            if buffer.getvalue():
+                yield buffer.getvalue().encode()
+
+        return chunks()
+
+    @api.model
+    def _stream_history_xlsx(self, domain=None):
+        """Yield the XLSX export of ``domain`` in chunks.
+
+        The workbook is written in constant memory mode to a temporary file,
+        which is then streamed; an XLSX file cannot be sent before it is
+        complete.
+        """
+        headers = self._get_history_export_headers()
+        batches = self._iter_history_export(domain)
+
+        def chunks():
+            with tempfile.NamedTemporaryFile(suffix=".xlsx") as file:
+                workbook = xlsxwriter.Workbook(file.name, {"constant_memory": True})
+                bold = workbook.add_format({"bold": True})
+                datetime_format = workbook.add_format(
+                    {"num_format": "yyyy-mm-dd hh:mm:ss"}
+                )
+                sheet, row_index = None, XLSX_SHEET_ROWS
+                for rows in batches:
+                    for row in rows:
+                        if row_index >= XLSX_SHEET_ROWS:
+                            sheet = workbook.add_worksheet()
+                            sheet.write_row(0, 0, headers, bold)
+                            sheet.set_column(0, len(headers) - 1, 18)
+                            row_index = 0
+                        row_index += 1
+                        for column, value in enumerate(row):
+                            if hasattr(value, "isoformat"):
+                                sheet.write_datetime(
+                                    row_index, column, value, datetime_format
+                                )
+                            elif value is not None:
+                                sheet.write(row_index, column, value)
+                if sheet is None:
+                    workbook.add_worksheet().write_row(0, 0, headers, bold)
+                workbook.close()
+                file.seek(0)
+                while chunk := file.read(XLSX_CHUNK_SIZE):
+                    yield chunk
+
+        return chunks()
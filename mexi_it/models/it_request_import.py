@@ -0,0 +1,229 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import csv
+import json
+import logging
+from itertools import islice
+
+from odoo import _, api, fields, models
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+
+class ItRequestImport(models.Model):
+    """Streaming bulk import of IT requests from CSV or JSONL files.
+
+    Files are read lazily in fixed-size chunks and every chunk is committed
+    on its own, so memory stays bounded and a failed or interrupted job
+    resumes from the first chunk that was not committed.
+    """
+
+    _name = "it.request.import"
+    _description = "IT Request Import"
+    _order = "create_date desc, id desc"
+
+    # Columns copied as-is onto the created requests
+    _import_fields = (
+        "name",
+        "request_type",
+        "state",
+        "priority",
+        "description",
+        "date_required",
+        "asset_category",
+        "asset_qty",
+        "asset_reason",
+        "asset_spec",
+        "software_name",
+        "software_action",
+        "access_profile",
+        "access_validity",
+        "business_reason",
+        "support_category",
+        "support_impact",
+        "reject_reason",
+        "resolution",
+        "submitted_date",
+        "approved_date",
+        "done_date",
+        "state_entered_at",
+    )
+
+    name = fields.Char(required=True)
+    file_path = fields.Char(
+        string="File Path",
+        required=True,
+        help="Path of the CSV or JSONL file on the server. Rows identify the "
+        "requester in an 'employee' column (badge, ID number, work email or "
+        "name) and optionally the technician in 'assigned_it_user' (login).",
+    )
+    file_format = fields.Selection(
+        selection=[("csv", "CSV"), ("jsonl", "JSON Lines")],
+        string="Format",
+        default="csv",
+        required=True,
+    )
+    chunk_size = fields.Integer(default=1000, required=True)
+    state = fields.Selection(
+        selection=[
+            ("draft", "Draft"),
+            ("queued", "Queued"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        default="draft",
+        required=True,
+        readonly=True,
+    )
+    chunks_done = fields.Integer(string="Committed Chunks", readonly=True)
+    rows_done = fields.Integer(string="Imported Rows", readonly=True)
+    last_error = fields.Text(string="Last Error", readonly=True)
+
+    _sql_constraints = [
+        (
+            "chunk_size_positive",
+            "CHECK(chunk_size > 0)",
+            "Chunk size must be positive.",
+        )
+    ]
+
+    # -------------------------------------------------------------------------
+    # Actions
+    # -------------------------------------------------------------------------
+    def action_queue(self):
+        """Queue the import, or resume it after a failure."""
+        if any(job.state not in ("draft", "failed") for job in self):
+            raise UserError(_("Only draft or failed imports can be started."))
+        self.write({"state": "queued", "last_error": False})
+        self.env.ref("mexi_it.ir_cron_it_request_import")._trigger()
+
+    @api.model
+    def _cron_run(self):
+        """Run queued imports and resume those left running by a dead worker."""
+        for job in self.search([("state", "in", ("queued", "running"))]):
+            job._run()
+
+    # -------------------------------------------------------------------------
+    # Import
+    # -------------------------------------------------------------------------
+    def _run(self):
+        """Import the remaining chunks of the file, one transaction each."""
+        self.ensure_one()
+        self.state = "running"
+        self._commit()
+        try:
+            open(self.file_path, "rb").close()
+        except OSError as e:
+            self.write({"state": "failed", "last_error": str(e)})
+            self._commit()
+            return
+        employees = self._build_employee_index()
+        users = self._build_user_index()
+        Request = self.env["it.request"].with_context(
+            tracking_disable=True, mail_create_nolog=True
+        )
+        chunk_number = self.chunks_done
+        for rows in self._read_chunks(skip=self.chunks_done * self.chunk_size):
+            chunk_number += 1
+            try:
+                with self.env.cr.savepoint():
+                    # create() reserves the folios of the whole chunk at once
+                    Request.create(
+                        [
+                            self._prepare_request_vals(row, employees, users)
+                            for row in rows
+                        ]
+                    )
+            except Exception as e:
+                _logger.warning(
+                    "IT request import %s failed on chunk %s", self.id, chunk_number
+                )
+                self.write(
+                    {
+                        "state": "failed",
+                        "last_error": _("Chunk %(chunk)s: %(error)s")
+                        % {"chunk": chunk_number, "error": e},
+                    }
+                )
+                self._commit()
+                return
+            self.write(
+                {
+                    "chunks_done": chunk_number,
+                    "rows_done": self.rows_done + len(rows),
+                }
+            )
+            self._commit()
+            # Keep the ORM cache from growing with the imported records
+            self.env.invalidate_all()
+        self.state = "done"
+        self._commit()
+
+    def _commit(self):
+        if not self.env.registry.in_test_mode():
+            self.env.cr.commit()
+
+    def _read_chunks(self, skip=0):
+        """Yield lists of at most ``chunk_size`` rows after ``skip`` rows."""
+        self.ensure_one()
+        with open(self.file_path, encoding="utf-8", newline="") as file:
+            if self.file_format == "csv":
+                rows = csv.DictReader(file)
+            else:
+                rows = (json.loads(line) for line in file if line.strip())
+            rows = islice(rows, skip, None)
+            while True:
+                chunk = list(islice(rows, self.chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+
+    def _build_employee_index(self):
+        """Map badges, ID numbers, work emails and names to employee ids."""
+        index = {}
+        employees = (
+            self.env["hr.employee"]
+            .with_context(active_test=False)
+            .search_read([], ["barcode", "identification_id", "work_email", "name"])
+        )
+        for employee in employees:
+            for key in ("barcode", "identification_id", "work_email", "name"):
+                if employee[key]:
+                    index.setdefault(employee[key].strip().lower(), employee["id"])
+        return index
+
+    def _build_user_index(self):
+        """Map logins to user ids."""
+        users = (
+            self.env["res.users"]
+            .with_context(active_test=False)
+            .search_read([], ["login"])
+        )
+        return {user["login"].lower(): user["id"] for user in users}
+
+    def _prepare_request_vals(self, row, employees, users):
+        """Convert an input row into ``it.request`` create values."""
+        Request = self.env["it.request"]
+        vals = {}
+        for name in self._import_fields:
+            value = row.get(name)
+            if value in (None, ""):
+                continue
+            if Request._fields[name].type == "integer":
+                value = int(value)
+            vals[name] = value
+        employee_key = str(row.get("employee") or "").strip().lower()
+        if employee_key not in employees:
+            raise UserError(_("Unknown employee: %s") % row.get("employee"))
+        vals["employee_id"] = employees[employee_key]
+        assignee_key = str(row.get("assigned_it_user") or "").strip().lower()
+        if assignee_key:
+            if assignee_key not in users:
+                raise UserError(
+                    _("Unknown IT user: %s") % row.get("assigned_it_user")
+                )
+            vals["assigned_it_user_id"] = users[assignee_key]
+        return vals
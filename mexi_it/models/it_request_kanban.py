@@ -0,0 +1,117 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import copy
+import time
+
+from odoo import api, models, tools
+
+# Columns holding the history: folded, so their records load on expand
+KANBAN_FOLDED_STATES = ("done", "rejected")
+KANBAN_GENERATION_SEQUENCE = "it_request_kanban_generation_seq"
+# Lifetime of cached counts, bounding the staleness left by concurrent reads
+KANBAN_CACHE_TTL = 60
+_GENERATION_KEY = "mexi_it.kanban_generation"
+
+
+class ItRequest(models.Model):
+    """Kanban board whose cost does not grow with the request history.
+
+    Every state has a column, done and rejected start folded, and the
+    per-state counts of ``web_read_group`` are cached per user and company
+    context. The cache is keyed by a generation read from a PostgreSQL
+    sequence, which writes changing the columns bump, so all workers drop
+    their entries at once.
+    """
+
+    _inherit = "it.request"
+
+    def init(self):
+        super().init()
+        self.env.cr.execute(
+            "CREATE SEQUENCE IF NOT EXISTS %s" % KANBAN_GENERATION_SEQUENCE
+        )
+
+    @api.model
+    def _read_group_expand_state(self, states, domain):
+        return [state for state, _label in self._fields["state"].selection]
+
+    @api.model
+    def web_read_group(
+        self,
+        domain,
+        fields,
+        groupby,
+        limit=None,
+        offset=0,
+        orderby=False,
+        lazy=True,
+    ):
+        if list(groupby) != ["state"]:
+            return super().web_read_group(
+                domain, fields, groupby, limit, offset, orderby, lazy
+            )
+        result = self._get_kanban_state_groups(
+            self._get_kanban_generation(),
+            int(time.time() // KANBAN_CACHE_TTL),
+            domain,
+            fields,
+            limit,
+            offset,
+            orderby,
+            lazy,
+        )
+        return copy.deepcopy(result)
+
+    @api.model
+    @tools.ormcache(
+        "generation",
+        "period",
+        "repr(domain)",
+        "tuple(fields)",
+        "limit",
+        "offset",
+        "orderby",
+        "lazy",
+        "self.env.uid",
+        "tuple(self.env.companies.ids)",
+        "self.env.lang",
+        "self.env.context.get('active_test', True)",
+    )
+    def _get_kanban_state_groups(
+        self, generation, period, domain, fields, limit, offset, orderby, lazy
+    ):
+        result = super().web_read_group(
+            domain, fields, ["state"], limit, offset, orderby, lazy
+        )
+        for group in result["groups"]:
+            if group.get("state") in KANBAN_FOLDED_STATES:
+                group["__fold"] = True
+        return result
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+    @api.model
+    def _get_kanban_generation(self):
+        self.env.cr.execute("SELECT last_value FROM %s" % KANBAN_GENERATION_SEQUENCE)
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def _bump_kanban_generation(self):
+        """Invalidate the cached counts of every worker.
+
+        The generation is bumped in the writing transaction, and again once
+        it is committed to drop the counts cached meanwhile from the old
+        data. Sequences are not transactional, so a reader whose snapshot
+        predates the commit can still cache stale counts under the second
+        generation; ``KANBAN_CACHE_TTL`` bounds how long they are served.
+        """
+        cr = self.env.cr
+        if cr.postcommit.data.get(_GENERATION_KEY):
+            return
+        cr.postcommit.data[_GENERATION_KEY] = True
+        query = "SELECT nextval('%s')" % KANBAN_GENERATION_SEQUENCE
+        cr.execute(query)
+        # nextval is not rolled back, so the committed cursor can run it
+        cr.postcommit.add(lambda: cr.execute(query))
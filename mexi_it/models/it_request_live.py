@@ -0,0 +1,150 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import logging
+import re
+from collections import defaultdict
+
+from odoo import api, models, tools
+from odoo.osv import expression
+from odoo.tools.safe_eval import safe_eval
+
+_logger = logging.getLogger(__name__)
+
+LIVE_UPDATE_NOTIFICATION = "mexi_it.request/changed"
+# Groups with a bus channel; requesters are notified on their own partner
+LIVE_UPDATE_GROUPS = (
+    "mexi_it.group_it_request_approver",
+    "mexi_it.group_it_request_it",
+)
+# Rule domains depending on the user cannot be shared by a group channel
+_USER_DEPENDENT_RULE = re.compile(r"\b(user|company_ids)\b")
+_PENDING_KEY = "mexi_it.live_updates"
+
+
+class ItRequest(models.Model):
+    """Push request changes to the open views through the bus.
+
+    Creates, unlinks and writes of displayed fields, queued by the CRUD
+    methods of ``it.request``, are collected per transaction and published
+    once before commit as ``{"id", "state"}`` entries, on the channel of
+    every group whose record rules show the request before or after the
+    change, and on the requester's partner. Groups whose rules depend on
+    the user are notified on the partner of each member instead.
+    """
+
+    _inherit = "it.request"
+
+    # -------------------------------------------------------------------------
+    # Publishing
+    # -------------------------------------------------------------------------
+    def _queue_live_update(self):
+        """Record the channels of ``self`` to notify at commit time."""
+        if not self:
+            return
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get(_PENDING_KEY)
+        if pending is None:
+            pending = precommit.data[_PENDING_KEY] = defaultdict(set)
+            precommit.add(self._publish_live_updates)
+        for request_id, channels in self._get_live_update_channels().items():
+            pending[request_id] |= channels
+
+    def _publish_live_updates(self):
+        """Send the queued changes, one notification per channel."""
+        pending = self.env.cr.precommit.data.pop(_PENDING_KEY, {})
+        requests = self.sudo().with_context(active_test=False).browse(pending)
+        existing = requests.exists()
+        for request_id, channels in existing._get_live_update_channels().items():
+            pending[request_id] |= channels
+        states = {request.id: request.state for request in existing}
+
+        by_channel = defaultdict(list)
+        for request_id, channels in pending.items():
+            for channel in channels:
+                by_channel[channel].append(
+                    {"id": request_id, "state": states.get(request_id, False)}
+                )
+        Bus = self.env["bus.bus"].sudo()
+        for (model, res_id), changes in by_channel.items():
+            Bus._sendone(
+                self.env[model].browse(res_id),
+                LIVE_UPDATE_NOTIFICATION,
+                {"requests": sorted(changes, key=lambda change: change["id"])},
+            )
+
+    def _get_live_update_channels(self):
+        """Return ``{request_id: {(model, res_id)}}`` of the channels to notify."""
+        requests = self.sudo().with_context(active_test=False)
+        channels = defaultdict(set)
+        for request in requests:
+            partner = request.requester_user_id.partner_id
+            if partner:
+                channels[request.id].add(("res.partner", partner.id))
+        for group, domain in self._get_live_update_group_domains():
+            if domain is not None:
+                for request in requests.filtered_domain(domain):
+                    channels[request.id].add(("res.groups", group.id))
+                continue
+            Rule = self.env["ir.rule"].sudo()
+            for user in group.users:
+                user_domain = Rule.with_user(user)._compute_domain(self._name, "read")
+                for request in requests.filtered_domain(user_domain or []):
+                    channels[request.id].add(("res.partner", user.partner_id.id))
+        return channels
+
+    @api.model
+    def _get_live_update_group_domains(self):
+        """Return ``[(group, domain)]``, the read rules of each channel group.
+
+        The domain is ``None`` when the rules depend on the user.
+        """
+        return [
+            (self.env["res.groups"].browse(group_id), domain)
+            for group_id, domain in self._get_live_update_rule_domains()
+        ]
+
+    @api.model
+    @tools.ormcache()
+    def _get_live_update_rule_domains(self):
+        # When the rules of a group do not depend on the user, one domain
+        # describes what every member can read. Rule changes clear the cache.
+        Rule = self.env["ir.rule"].sudo()
+        result = []
+        for xmlid in LIVE_UPDATE_GROUPS:
+            group = self.env.ref(xmlid, raise_if_not_found=False)
+            if not group:
+                continue
+            rules = Rule.search(
+                [
+                    ("model_id.model", "=", self._name),
+                    ("groups", "in", group.ids),
+                    ("perm_read", "=", True),
+                ]
+            )
+            if any(
+                _USER_DEPENDENT_RULE.search(rule.domain_force or "") for rule in rules
+            ):
+                _logger.warning(
+                    "Record rules of %s depend on the user: IT request live "
+                    "updates are sent to each member instead of the group",
+                    xmlid,
+                )
+                result.append((group.id, None))
+                continue
+            domains = [
+                safe_eval(rule.domain_force or "[]", rule._eval_context())
+                for rule in rules
+            ]
+            result.append((group.id, expression.OR(domains) if domains else []))
+        return tuple(result)
+
+    @api.model
+    def _get_live_update_user_channels(self):
+        """Return the group channels the current user listens to."""
+        groups = self.env["res.groups"]
+        for xmlid in LIVE_UPDATE_GROUPS:
+            group = self.env.ref(xmlid, raise_if_not_found=False)
+            if group and self.env.user.has_group(xmlid):
+                groups |= group
+        return list(groups)
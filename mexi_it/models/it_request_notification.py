@@ -0,0 +1,249 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import logging
+import textwrap
+from collections import defaultdict
+
+from odoo import Command, api, fields, models
+from odoo.tools import plaintext2html
+
+_logger = logging.getLogger(__name__)
+
+
+class ItRequestNotification(models.Model):
+    """Status change waiting to be posted and mailed.
+
+    Transitions only insert rows here. The dispatch job posts the chatter
+    messages in bulk and sends one mail per recipient and batch, so mass
+    transitions do not render or queue mail in the user's request.
+    """
+
+    _name = "it.request.notification"
+    _description = "IT Request Notification"
+    _order = "id"
+    _log_access = False
+
+    request_id = fields.Many2one(
+        comodel_name="it.request",
+        string="Request",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    author_id = fields.Many2one(comodel_name="res.partner", string="Author")
+    body = fields.Text(required=True)
+    date = fields.Datetime(required=True, default=fields.Datetime.now)
+
+    @api.model
+    def _enqueue(self, requests, body):
+        """Queue a status change of ``requests`` and wake up the dispatcher.
+
+        :param body: message text, or a callable returning it for a request
+        """
+        if not requests:
+            return
+        self.sudo().create(
+            [
+                {
+                    "request_id": request.id,
+                    "author_id": self.env.user.partner_id.id,
+                    "body": body(request) if callable(body) else body,
+                }
+                for request in requests
+            ]
+        )
+        self.env.ref("mexi_it.ir_cron_it_request_notification").sudo()._trigger()
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+    @api.model
+    def _cron_dispatch(self, batch_size=500):
+        """Dispatch queued notifications in batches, one transaction each.
+
+        Rows are locked with SKIP LOCKED, so concurrent workers share the
+        queue instead of waiting on each other. A failing batch is retried
+        event by event; events that still fail are logged and dropped so
+        they cannot block the queue.
+        """
+        while True:
+            self.env.cr.execute(
+                """
+                SELECT id
+                  FROM it_request_notification
+                 ORDER BY id
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+                """,
+                [batch_size],
+            )
+            events = self.browse(row[0] for row in self.env.cr.fetchall())
+            if not events:
+                break
+            try:
+                with self.env.cr.savepoint():
+                    events._dispatch()
+            except Exception:
+                _logger.exception(
+                    "Dispatch of %s IT request notifications failed, "
+                    "retrying one by one",
+                    len(events),
+                )
+                for event in events:
+                    try:
+                        with self.env.cr.savepoint():
+                            event._dispatch()
+                    except Exception:
+                        _logger.exception(
+                            "Dropping notification %s of IT request %s: %s",
+                            event.id,
+                            event.request_id.id,
+                            event.body,
+                        )
+            events.unlink()
+            if not self.env.registry.in_test_mode():
+                self.env.cr.commit()
+            self.env.invalidate_all()
+
+    def _dispatch(self):
+        """Post the chatter messages and notify every recipient once.
+
+        Like ``message_post``, followers are notified when subscribed to
+        discussions and the other involved parties directly.
+        """
+        messages = self._create_messages()
+        requests = self.request_id.with_context(active_test=False)
+        partner_map = requests._get_notification_partner_map()
+        followers = requests._get_follower_partner_map()
+        subscribers = requests._get_follower_partner_map(
+            self.env.ref("mail.mt_comment")
+        )
+        entries = defaultdict(list)
+        for event, message in zip(self, messages):
+            request_id = event.request_id.id
+            recipients = set(partner_map[request_id]) - followers[request_id]
+            recipients |= subscribers[request_id]
+            recipients.discard(event.author_id.id)
+            for partner_id in recipients:
+                entries[partner_id].append((event, message))
+
+        notifications = []
+        mails = []
+        mail_entries = []
+        digests = []
+        partners = self.env["res.partner"].sudo().browse(sorted(entries))
+        for partner in partners:
+            user = partner.user_ids[:1]
+            if user.it_request_digest in ("hourly", "daily"):
+                # Kept for the recipient's next digest
+                digests += [
+                    {
+                        "partner_id": partner.id,
+                        "request_id": event.request_id.id,
+                        "body": event.body,
+                        "date": event.date,
+                    }
+                    for event, _message in entries[partner.id]
+                ]
+            elif user and user.notification_type == "inbox":
+                notifications += [
+                    {
+                        "mail_message_id": message.id,
+                        "res_partner_id": partner.id,
+                        "notification_type": "inbox",
+                    }
+                    for _event, message in entries[partner.id]
+                ]
+            elif partner.email:
+                lines = [
+                    self._prepare_line(event.request_id, event.body, event.date)
+                    for event, _message in entries[partner.id]
+                ]
+                mails.append(self._prepare_mail(partner, lines))
+                mail_entries.append((partner, entries[partner.id]))
+                if len(lines) == 1:
+                    # Sent as the chatter message, which gets bounces
+                    mails[-1].update(
+                        mail_message_id=entries[partner.id][0][1].id,
+                        is_notification=True,
+                    )
+        mail_records = self.env["mail.mail"].sudo().create(mails)
+        # Email notifications give the chatter its delivery status
+        for mail, (partner, partner_entries) in zip(mail_records, mail_entries):
+            notifications += [
+                {
+                    "mail_message_id": message.id,
+                    "mail_mail_id": mail.id,
+                    "res_partner_id": partner.id,
+                    "notification_type": "email",
+                    "notification_status": "ready",
+                    "is_read": True,
+                }
+                for _event, message in partner_entries
+            ]
+        self.env["mail.notification"].sudo().create(notifications)
+        self.env["it.request.digest"].sudo().create(digests)
+
+    def _create_messages(self):
+        """Create the chatter messages of the events in one batch."""
+        subtype = self.env.ref("mail.mt_comment")
+        return (
+            self.env["mail.message"]
+            .sudo()
+            .create(
+                [
+                    {
+                        "model": "it.request",
+                        "res_id": event.request_id.id,
+                        "body": plaintext2html(event.body),
+                        "author_id": event.author_id.id,
+                        "date": event.date,
+                        "message_type": "notification",
+                        "subtype_id": subtype.id,
+                    }
+                    for event in self
+                ]
+            )
+        )
+
+    @api.model
+    def _prepare_line(self, request, body, date):
+        """Return the mail line describing one status change of ``request``."""
+        return {
+            "name": request.name,
+            "url": request.get_base_url() + request._notify_get_action_link("view"),
+            "body": body,
+            "date": date,
+        }
+
+    @api.model
+    def _render_lines(self, partner, lines):
+        """Return ``(subject, body)`` of a message listing ``lines``."""
+        env = self.with_context(lang=partner.lang).env
+        if len(lines) == 1:
+            subject = "%s: %s" % (
+                lines[0]["name"],
+                textwrap.shorten(lines[0]["body"], 80, placeholder="…"),
+            )
+        else:
+            subject = env._("%s IT request updates") % len(lines)
+        body = env["ir.qweb"]._render(
+            "mexi_it.it_request_notification_mail",
+            {"partner": partner, "lines": lines},
+        )
+        return subject, body
+
+    @api.model
+    def _prepare_mail(self, partner, lines):
+        """Return ``mail.mail`` values listing ``lines`` for ``partner``."""
+        subject, body = self._render_lines(partner, lines)
+        vals = {
+            "subject": subject,
+            "body_html": body,
+            "recipient_ids": [Command.link(partner.id)],
+            "auto_delete": True,
+        }
+        if self.env.company.email:
+            vals["email_from"] = self.env.company.email_formatted
+        return vals
@@ -0,0 +1,148 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import threading
+from contextlib import contextmanager
+
+from odoo import api, models, tools
+from odoo.tools import str2bool
+from odoo.tools.profiler import Profiler
+
+PROFILE_SESSION = "mexi_it"
+# Set while a capture is running, so nested profiled calls are part of it
+_capture = threading.local()
+
+
+class ItRequest(models.Model):
+    """Optional profiling of the request workflow.
+
+    When enabled in the settings, transitions, ``create`` and ``write`` run
+    under the ORM profiler, which records Python stacks and every SQL query
+    with its duration and origin into a downloadable ``ir.profile`` record.
+    When disabled, the only cost is one cached lookup per call.
+    """
+
+    _inherit = "it.request"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        with self._profile("create", len(vals_list)):
+            return super().create(vals_list)
+
+    def write(self, vals):
+        with self._profile("write"):
+            return super().write(vals)
+
+    def action_submit(self):
+        with self._profile("action_submit"):
+            return super().action_submit()
+
+    def action_approve(self):
+        with self._profile("action_approve"):
+            return super().action_approve()
+
+    def action_reject(self):
+        with self._profile("action_reject"):
+            return super().action_reject()
+
+    def action_start(self):
+        with self._profile("action_start"):
+            return super().action_start()
+
+    def action_done(self):
+        with self._profile("action_done"):
+            return super().action_done()
+
+    def action_claim(self):
+        with self._profile("action_claim"):
+            return super().action_claim()
+
+    # -------------------------------------------------------------------------
+    # Profiling
+    # -------------------------------------------------------------------------
+    @api.model
+    @tools.ormcache()
+    def _get_profiling_scope(self):
+        """Return ``(user ids, method names)`` to profile, or None when off.
+
+        Empty sets mean every user or every method. Changing a parameter
+        clears the registry cache, so the scope is picked up immediately.
+        """
+        ICP = self.env["ir.config_parameter"].sudo()
+        if not str2bool(ICP.get_param("mexi_it.profiling", "False")):
+            return None
+        logins = ICP.get_param("mexi_it.profiling_logins", "")
+        methods = ICP.get_param("mexi_it.profiling_methods", "")
+        logins = [login.strip() for login in logins.split(",") if login.strip()]
+        user_ids = (
+            self.env["res.users"]
+            .with_context(active_test=False)
+            .search([("login", "in", logins)])
+            .ids
+        )
+        if logins and not user_ids:
+            return None
+        return (
+            frozenset(user_ids),
+            frozenset(name.strip() for name in methods.split(",") if name.strip()),
+        )
+
+    @contextmanager
+    def _profile(self, method, count=None):
+        """Capture ``method`` when profiling is enabled for it and the user."""
+        scope = self._get_profiling_scope()
+        if (
+            scope is None
+            or getattr(_capture, "active", False)
+            or (scope[0] and self.env.uid not in scope[0])
+            or (scope[1] and method not in scope[1])
+        ):
+            yield
+            return
+        description = "%s.%s (%s records) by %s" % (
+            self._name,
+            method,
+            len(self) if count is None else count,
+            self.env.user.login,
+        )
+        _capture.active = True
+        try:
+            with Profiler(
+                collectors=["sql", "traces_async"],
+                db=self.env.cr.dbname,
+                profile_session=PROFILE_SESSION,
+                description=description,
+            ):
+                yield
+        finally:
+            _capture.active = False
+        self._prune_profiles()
+
+    @api.model
+    def _prune_profiles(self):
+        """Keep only the most recent captures, as set in the settings.
+
+        The profiler commits the capture on its own cursor, which the request
+        transaction cannot see, so pruning uses a new cursor as well. Rows
+        another prune is deleting are skipped instead of waited on.
+        """
+        retention = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("mexi_it.profiling_retention", 20)
+        )
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                """
+                DELETE FROM ir_profile
+                 WHERE id IN (
+                        SELECT id
+                          FROM ir_profile
+                         WHERE session = %s
+                      ORDER BY id DESC
+                        OFFSET %s
+                           FOR UPDATE SKIP LOCKED
+                 )
+                """,
+                [PROFILE_SESSION, retention],
+            )
@@ -0,0 +1,101 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import _, fields, models
+from odoo.exceptions import AccessError, UserError
+
+
+class ItRequestQueue(models.Model):
+    """Shared IT team queue.
+
+    One entry per submitted support request, visible to every technician,
+    instead of one to-do activity per IT user.
+    """
+
+    _name = "it.request.queue"
+    _description = "IT Team Queue Entry"
+    _order = "priority desc, create_date, id"
+    _rec_name = "request_id"
+
+    request_id = fields.Many2one(
+        comodel_name="it.request",
+        string="Request",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+    )
+    priority = fields.Selection(
+        related="request_id.priority",
+        store=True,
+    )
+    employee_id = fields.Many2one(related="request_id.employee_id")
+    support_category = fields.Selection(related="request_id.support_category")
+    support_impact = fields.Selection(related="request_id.support_impact")
+    assigned_it_user_id = fields.Many2one(related="request_id.assigned_it_user_id")
+    state = fields.Selection(
+        selection=[
+            ("open", "Open"),
+            ("claimed", "Claimed"),
+            ("closed", "Closed"),
+        ],
+        default="open",
+        required=True,
+        readonly=True,
+        index=True,
+    )
+    claimed_by_id = fields.Many2one(
+        comodel_name="res.users",
+        string="Claimed By",
+        readonly=True,
+    )
+    claimed_date = fields.Datetime(string="Claimed On", readonly=True)
+
+    _sql_constraints = [
+        (
+            "request_uniq",
+            "unique(request_id)",
+            "A request can only be queued once.",
+        )
+    ]
+
+    def action_claim(self):
+        """Claim the queued requests for the current user.
+
+        The entry is closed and the request assigned in the same
+        transaction; the conditional update guarantees that only one
+        technician wins when several claim at once.
+        """
+        if not self.env.user.has_group("mexi_it.group_it_request_it"):
+            raise AccessError(_("Only IT users can claim requests."))
+        if not self:
+            return
+        self.flush_recordset()
+        self.env.cr.execute(
+            """
+            UPDATE it_request_queue
+               SET state = 'claimed',
+                   claimed_by_id = %s,
+                   claimed_date = %s,
+                   write_uid = %s,
+                   write_date = %s
+             WHERE id IN %s
+               AND state = 'open'
+         RETURNING request_id
+            """,
+            [
+                self.env.uid,
+                fields.Datetime.now(),
+                self.env.uid,
+                fields.Datetime.now(),
+                tuple(self.ids),
+            ],
+        )
+        request_ids = [row[0] for row in self.env.cr.fetchall()]
+        if len(request_ids) != len(self):
+            raise UserError(
+                _("This request was already taken by another technician.")
+            )
+        self.invalidate_recordset(["state", "claimed_by_id", "claimed_date"])
+        self.env["it.request"].browse(request_ids).write(
+            {"assigned_it_user_id": self.env.uid}
+        )
@@ -0,0 +1,100 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+from .it_request import request_selection
+
+
+class ItRequestSla(models.Model):
+    """Response and resolution targets for IT requests.
+
+    A request follows the first matching policy by sequence; empty criteria
+    match any value, and more specific policies win over generic ones.
+    """
+
+    _name = "it.request.sla"
+    _description = "IT Request SLA Policy"
+    _order = "sequence, id"
+
+    name = fields.Char(required=True, translate=True)
+    sequence = fields.Integer(default=10)
+    active = fields.Boolean(default=True)
+    request_type = fields.Selection(
+        selection=request_selection("request_type"),
+        help="Leave empty to apply to every request type.",
+    )
+    priority = fields.Selection(
+        selection=request_selection("priority"),
+        help="Leave empty to apply to every priority.",
+    )
+    support_impact = fields.Selection(
+        selection=request_selection("support_impact"),
+        string="Business Impact",
+        help="Leave empty to apply to every impact.",
+    )
+    response_hours = fields.Float(
+        string="Response Time (h)",
+        required=True,
+        help="Hours from submission until the request must leave the "
+        "submitted state.",
+    )
+    resolution_hours = fields.Float(
+        string="Resolution Time (h)",
+        required=True,
+        help="Hours from submission until the request must be done.",
+    )
+    escalation_action = fields.Selection(
+        selection=[
+            ("notify", "Notify"),
+            ("priority", "Raise priority"),
+            ("reassign", "Reassign"),
+        ],
+        default="notify",
+        required=True,
+        help="Applied by the escalation job when a deadline is missed. "
+        "Every escalation also notifies the requester, manager and assignee.",
+    )
+    escalation_user_id = fields.Many2one(
+        comodel_name="res.users",
+        string="Escalate To",
+        help="Technician taking over breached requests. Leave empty to pick "
+        "one with the auto-assignment strategy.",
+    )
+
+    _sql_constraints = [
+        (
+            "hours_positive",
+            "CHECK(response_hours > 0 AND resolution_hours > 0)",
+            "SLA times must be positive.",
+        )
+    ]
+
+    @api.model
+    def _get_policy_matcher(self):
+        """Return a function mapping a request to its policy."""
+        criteria = ("request_type", "priority", "support_impact")
+        policies = self.search([]).sorted(
+            lambda p: (p.sequence, -sum(bool(p[name]) for name in criteria), p.id)
+        )
+
+        def match(request):
+            for policy in policies:
+                if all(
+                    not policy[name] or policy[name] == request[name]
+                    for name in criteria
+                ):
+                    return policy
+            return self.browse()
+
+        return match
+
+    def _get_deadlines(self, start):
+        """Return the ``(response, resolution)`` deadlines from ``start``."""
+        self.ensure_one()
+        return (
+            start + timedelta(hours=self.response_hours),
+            start + timedelta(hours=self.resolution_hours),
+        )
@@ -0,0 +1,153 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import _, api, fields, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+from odoo.tools.sql import create_index
+
+from .it_request import request_selection
+
+# Columns the cycle time percentiles can be grouped by
+CYCLE_TIME_GROUPBY = {
+    "state": SQL("s.state"),
+    "request_type": SQL("r.request_type"),
+    "technician": SQL("r.assigned_it_user_id"),
+}
+
+
+class ItRequestStateLog(models.Model):
+    """Append-only log of the state transitions of IT requests.
+
+    One row per transition, the creation included, written in batch by
+    ``it.request.write``. Rows are never updated, so the table stays
+    physically ordered by date and a BRIN index serves date range scans.
+    """
+
+    _name = "it.request.state.log"
+    _description = "IT Request State Log"
+    _order = "date, id"
+    _log_access = False
+
+    request_id = fields.Many2one(
+        comodel_name="it.request",
+        string="Request",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    from_state = fields.Selection(
+        selection=request_selection("state"), string="From"
+    )
+    to_state = fields.Selection(
+        selection=request_selection("state"), string="To", required=True
+    )
+    user_id = fields.Many2one(comodel_name="res.users", string="User")
+    date = fields.Datetime(required=True)
+
+    def init(self):
+        create_index(
+            self.env.cr,
+            "it_request_state_log_date_brin",
+            self._table,
+            ["date"],
+            method="brin",
+        )
+
+    def write(self, vals):
+        raise UserError(_("The state log of IT requests cannot be modified."))
+
+    @api.model
+    def _log_transitions(self, requests, previous_states, date):
+        """Log the transitions of ``requests`` from ``previous_states``.
+
+        :param previous_states: ``{request_id: state}`` before the change,
+            empty for new requests
+        """
+        self.sudo().create(
+            [
+                {
+                    "request_id": request.id,
+                    "from_state": previous_states.get(request.id),
+                    "to_state": request.state,
+                    "user_id": self.env.uid,
+                    "date": date,
+                }
+                for request in requests
+                if previous_states.get(request.id) != request.state
+            ]
+        )
+
+    # -------------------------------------------------------------------------
+    # Analytics
+    # -------------------------------------------------------------------------
+    @api.model
+    def get_cycle_time_percentiles(
+        self,
+        groupby=("state",),
+        date_from=None,
+        date_to=None,
+        percentiles=(0.5, 0.9, 0.95),
+    ):
+        """Return the hours spent in each state, as percentiles.
+
+        Only completed stays are measured: a request still in a state does
+        not count for it. Stays are selected on the date they started and
+        restricted to the requests the user can read.
+
+        :param groupby: names among ``state``, ``request_type`` and
+            ``technician`` (the technician currently assigned)
+        :return: one dict per group with the ``groupby`` keys, ``count`` and
+            ``p50``, ``p90``... in hours
+        """
+        unknown = set(groupby) - set(CYCLE_TIME_GROUPBY)
+        if unknown:
+            raise UserError(_("Cannot group cycle times by %s") % ", ".join(unknown))
+        requests = self.env["it.request"].with_context(active_test=False)._search([])
+        keys = [CYCLE_TIME_GROUPBY[name] for name in groupby]
+        self.env.flush_all()
+        self.env.cr.execute(
+            SQL(
+                """
+                WITH stays AS (
+                    SELECT l.request_id,
+                           l.to_state AS state,
+                           l.date AS entered,
+                           lead(l.date) OVER (
+                               PARTITION BY l.request_id ORDER BY l.date, l.id
+                           ) AS left_at
+                      FROM it_request_state_log l
+                     WHERE %(lower)s
+                )
+                SELECT %(keys)s,
+                       count(*),
+                       percentile_cont(%(percentiles)s::float8[]) WITHIN GROUP (
+                           ORDER BY extract(epoch FROM s.left_at - s.entered) / 3600
+                       )
+                  FROM stays s
+                  JOIN it_request r ON r.id = s.request_id
+                 WHERE s.left_at IS NOT NULL
+                   AND %(upper)s
+                   AND r.id IN (%(requests)s)
+                 GROUP BY %(keys)s
+                 ORDER BY %(keys)s
+                """,
+                # The lower bound can be applied before the window: the stay
+                # following a selected one always starts later
+                lower=SQL("l.date >= %s", date_from) if date_from else SQL("TRUE"),
+                upper=SQL("s.entered < %s", date_to) if date_to else SQL("TRUE"),
+                keys=SQL(", ").join(keys),
+                percentiles=list(percentiles),
+                requests=requests.subselect(),
+            )
+        )
+        result = []
+        for row in self.env.cr.fetchall():
+            *values, count, hours = row
+            group = dict(zip(groupby, values), count=count)
+            group.update(
+                ("p%g" % (percentile * 100), value)
+                for percentile, value in zip(percentiles, hours)
+            )
+            result.append(group)
+        return result
@@ -0,0 +1,209 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+import heapq
+from collections import defaultdict
+from datetime import datetime
+
+from odoo import api, fields, models
+
+from .it_request import ASSIGNMENT_LOAD_STATES
+
+
+class ItRequestTechnicianLoad(models.Model):
+    """Open workload per IT technician.
+
+    One row per technician, updated incrementally by ``it.request`` writes,
+    so the assignment engine never has to scan requests to pick someone.
+    """
+
+    _name = "it.request.technician.load"
+    _description = "IT Technician Load"
+    _order = "load, last_assigned_at, id"
+    _rec_name = "user_id"
+
+    user_id = fields.Many2one(
+        comodel_name="res.users",
+        string="Technician",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+    )
+    load = fields.Integer(
+        string="Weighted Load",
+        readonly=True,
+        help="Sum of priority/impact weights of open assigned requests.",
+    )
+    open_count = fields.Integer(string="Open Requests", readonly=True)
+    last_assigned_at = fields.Datetime(string="Last Assignment", readonly=True)
+
+    _sql_constraints = [
+        (
+            "user_uniq",
+            "unique(user_id)",
+            "A technician can only have one load counter.",
+        )
+    ]
+
+    # -------------------------------------------------------------------------
+    # Counters
+    # -------------------------------------------------------------------------
+    @api.model
+    def _ensure_rows(self, user_ids):
+        """Create missing counters for ``user_ids``."""
+        if not user_ids:
+            return
+        self.env.cr.execute(
+            """
+            INSERT INTO it_request_technician_load (user_id, load, open_count)
+            SELECT unnest(%s::int[]), 0, 0
+                ON CONFLICT (user_id) DO NOTHING
+            """,
+            [list(user_ids)],
+        )
+
+    @api.model
+    def _apply_load_change(self, before, after):
+        """Apply the difference between two ``{user id: [load, count]}``
+        snapshots as atomic increments."""
+        deltas = []
+        for user_id in before.keys() | after.keys():
+            old_load, old_count = before.get(user_id, (0, 0))
+            new_load, new_count = after.get(user_id, (0, 0))
+            if (old_load, old_count) != (new_load, new_count):
+                deltas.append((user_id, new_load - old_load, new_count - old_count))
+        if not deltas:
+            return
+        # Update in user order so concurrent transactions lock rows alike
+        deltas.sort()
+        self._ensure_rows([user_id for user_id, _load, _count in deltas])
+        self.env.cr.execute(
+            """
+            UPDATE it_request_technician_load l
+               SET load = l.load + d.load,
+                   open_count = l.open_count + d.open_count
+              FROM (VALUES %s) AS d(user_id, load, open_count)
+             WHERE l.user_id = d.user_id
+            """
+            % ", ".join(["(%s, %s, %s)"] * len(deltas)),
+            [value for delta in deltas for value in delta],
+        )
+        self.invalidate_model(["load", "open_count"])
+
+    @api.model
+    def _cron_rebuild(self):
+        """Recompute every counter from open requests to correct drift."""
+        Request = self.env["it.request"]
+        after = defaultdict(lambda: [0, 0])
+        groups = Request.sudo()._read_group(
+            [
+                ("state", "in", ASSIGNMENT_LOAD_STATES),
+                ("assigned_it_user_id", "!=", False),
+            ],
+            ["assigned_it_user_id", "priority", "support_impact"],
+            ["__count"],
+        )
+        for user, priority, support_impact, count in groups:
+            weight = Request._get_assignment_weight_for(priority, support_impact)
+            after[user.id][0] += weight * count
+            after[user.id][1] += count
+        self.env.cr.execute(
+            """
+            SELECT user_id, load, open_count
+              FROM it_request_technician_load
+             ORDER BY user_id
+               FOR UPDATE
+            """
+        )
+        before = {
+            user_id: (load, count) for user_id, load, count in self.env.cr.fetchall()
+        }
+        self._apply_load_change(before, after)
+
+    # -------------------------------------------------------------------------
+    # Assignment
+    # -------------------------------------------------------------------------
+    @api.model
+    def _lock_counter(self, user_id):
+        """Lock the counter of ``user_id`` unless another transaction holds it."""
+        self.env.cr.execute(
+            """
+            SELECT 1
+              FROM it_request_technician_load
+             WHERE user_id = %s
+               FOR UPDATE SKIP LOCKED
+            """,
+            [user_id],
+        )
+        return bool(self.env.cr.fetchone())
+
+    @api.model
+    def _assign_technicians(self, requests):
+        """Assign ``requests`` to IT technicians.
+
+        Each pick is a heap pop over the counters read without locking; only
+        the picked technician's counter is locked, skipping the ones another
+        transaction is assigning, so concurrent submissions do not wait on
+        each other. The balance is approximate under concurrency and
+        ``_cron_rebuild`` corrects any drift. Requests left over when every
+        counter is locked stay unassigned in the shared queue.
+        """
+        it_group = self.env.ref(
+            "mexi_it.group_it_request_it", raise_if_not_found=False
+        )
+        technicians = it_group.users.filtered("active") if it_group else False
+        if not requests or not technicians:
+            return
+        strategy = (
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("mexi_it.assignment_strategy", "least_loaded")
+        )
+        self._ensure_rows(technicians.ids)
+        self.env.cr.execute(
+            """
+            SELECT user_id, load, last_assigned_at
+              FROM it_request_technician_load
+             WHERE user_id IN %s
+            """,
+            [tuple(technicians.ids)],
+        )
+        heap = []
+        for user_id, load, last_assigned_at in self.env.cr.fetchall():
+            recency = (last_assigned_at or datetime.min, 0)
+            key = recency if strategy == "round_robin" else (load, recency)
+            heap.append((key, user_id, load))
+        heapq.heapify(heap)
+
+        assignments = defaultdict(list)
+        locked = set()
+        # Most urgent requests get the least loaded technicians first
+        ordered = requests.sorted(lambda r: r._get_assignment_weight(), reverse=True)
+        now = fields.Datetime.now()
+        for sequence, request in enumerate(ordered, start=1):
+            while heap:
+                _key, user_id, load = heapq.heappop(heap)
+                if user_id in locked or self._lock_counter(user_id):
+                    locked.add(user_id)
+                    break
+            else:
+                break
+            assignments[user_id].append(request.id)
+            load += request._get_assignment_weight()
+            recency = (now, sequence)
+            key = recency if strategy == "round_robin" else (load, recency)
+            heapq.heappush(heap, (key, user_id, load))
+        if not assignments:
+            return
+
+        for user_id, request_ids in assignments.items():
+            requests.browse(request_ids).write({"assigned_it_user_id": user_id})
+        self.env.cr.execute(
+            """
+            UPDATE it_request_technician_load
+               SET last_assigned_at = %s
+             WHERE user_id IN %s
+            """,
+            [now, tuple(assignments)],
+        )
+        self.invalidate_model(["last_assigned_at"])
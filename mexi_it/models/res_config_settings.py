@@ -0,0 +1,71 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import fields, models
+
+
+class ResConfigSettings(models.TransientModel):
+    _inherit = "res.config.settings"
+
+    it_request_assignment_strategy = fields.Selection(
+        selection=[
+            ("least_loaded", "Least loaded technician"),
+            ("round_robin", "Round robin"),
+        ],
+        string="Support Assignment",
+        default="least_loaded",
+        config_parameter="mexi_it.assignment_strategy",
+        help="How new support requests are auto-assigned to IT technicians. "
+        "Least loaded weighs open requests by priority and business impact.",
+    )
+    it_request_archive_after_days = fields.Integer(
+        string="Archive Closed Requests After (days)",
+        default=365,
+        config_parameter="mexi_it.archive_after_days",
+        help="Done or rejected requests are archived and their chatter "
+        "compacted after this many days. Use 0 to keep them active.",
+    )
+    it_request_stale_draft_days = fields.Integer(
+        string="Close Drafts After (days)",
+        default=30,
+        config_parameter="mexi_it.stale_draft_days",
+        help="Drafts without activity for this many days are archived "
+        "automatically. Use 0 to keep them.",
+    )
+    it_request_stale_remind_days = fields.Integer(
+        string="Remind Technician After (days)",
+        default=7,
+        config_parameter="mexi_it.stale_remind_days",
+        help="Requests in progress without activity for this many days get "
+        "a to-do for their technician. Use 0 to disable.",
+    )
+    it_request_stale_escalate_days = fields.Integer(
+        string="Escalate After (days)",
+        default=14,
+        config_parameter="mexi_it.stale_escalate_days",
+        help="Requests in progress without activity for this many days are "
+        "notified to the requester and followers. Use 0 to disable.",
+    )
+    it_request_profiling = fields.Boolean(
+        string="Profile IT Requests",
+        config_parameter="mexi_it.profiling",
+        help="Record Python stacks and SQL queries of request transitions, "
+        "create and write as downloadable profiles.",
+    )
+    it_request_profiling_logins = fields.Char(
+        string="Profiled Users",
+        config_parameter="mexi_it.profiling_logins",
+        help="Comma-separated logins. Leave empty to profile every user.",
+    )
+    it_request_profiling_methods = fields.Char(
+        string="Profiled Methods",
+        config_parameter="mexi_it.profiling_methods",
+        help="Comma-separated methods, e.g. action_submit,write. Leave empty "
+        "to profile create, write and every transition.",
+    )
+    it_request_profiling_retention = fields.Integer(
+        string="Profiles Kept",
+        default=20,
+        config_parameter="mexi_it.profiling_retention",
+        help="Older profiles are deleted when a new one is captured.",
+    )
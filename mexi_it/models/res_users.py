@@ -0,0 +1,29 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import fields, models
+
+
+class ResUsers(models.Model):
+    _inherit = "res.users"
+
+    it_request_digest = fields.Selection(
+        selection=[
+            ("immediate", "Immediately"),
+            ("hourly", "Hourly digest"),
+            ("daily", "Daily digest"),
+        ],
+        string="IT Request Updates",
+        default="immediate",
+        required=True,
+        help="Receive IT request status changes as they happen, or grouped "
+        "in one message per hour or per day.",
+    )
+
+    @property
+    def SELF_READABLE_FIELDS(self):
+        return super().SELF_READABLE_FIELDS + ["it_request_digest"]
+
+    @property
+    def SELF_WRITEABLE_FIELDS(self):
+        return super().SELF_WRITEABLE_FIELDS + ["it_request_digest"]
@@ -0,0 +1 @@
+from . import it_request_report
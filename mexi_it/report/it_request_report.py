@@ -0,0 +1,101 @@
+# Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+# License OPL-1.0
+
+from odoo import fields, models, tools
+
+from ..models.it_request import request_selection
+
+
+class ItRequestReport(models.Model):
+    """IT request analysis backed by a database view.
+
+    Cycle times between workflow steps are plain columns computed by
+    PostgreSQL, so the dashboard pivot and graph aggregate in the database.
+    """
+
+    _name = "it.request.report"
+    _description = "IT Request Analysis"
+    _auto = False
+    _order = "create_date desc"
+
+    name = fields.Char(string="Folio", readonly=True)
+    request_type = fields.Selection(
+        selection=request_selection("request_type"), readonly=True
+    )
+    state = fields.Selection(selection=request_selection("state"), readonly=True)
+    priority = fields.Selection(
+        selection=request_selection("priority"), readonly=True
+    )
+    employee_id = fields.Many2one(
+        comodel_name="hr.employee", string="Employee", readonly=True
+    )
+    department_id = fields.Many2one(
+        comodel_name="hr.department", string="Department", readonly=True
+    )
+    assigned_it_user_id = fields.Many2one(
+        comodel_name="res.users", string="Assigned IT User", readonly=True
+    )
+    approved_by_id = fields.Many2one(
+        comodel_name="res.users", string="Approved By", readonly=True
+    )
+    create_date = fields.Datetime(string="Created On", readonly=True)
+    submitted_date = fields.Datetime(string="Submitted Date", readonly=True)
+    approved_date = fields.Datetime(string="Approval Date", readonly=True)
+    started_date = fields.Datetime(string="Start Date", readonly=True)
+    done_date = fields.Datetime(string="Completion Date", readonly=True)
+    nbr = fields.Integer(string="# Requests", readonly=True)
+    hours_to_approve = fields.Float(
+        string="Hours Submit → Approve", readonly=True, aggregator="avg"
+    )
+    hours_to_start = fields.Float(
+        string="Hours Until Start",
+        readonly=True,
+        aggregator="avg",
+        help="From approval, or from submission for support requests.",
+    )
+    hours_to_finish = fields.Float(
+        string="Hours Start → Done", readonly=True, aggregator="avg"
+    )
+    hours_total = fields.Float(
+        string="Hours Submit → Done", readonly=True, aggregator="avg"
+    )
+
+    def _select(self):
+        return """
+            SELECT r.id,
+                   r.name,
+                   r.request_type,
+                   r.state,
+                   r.priority,
+                   r.employee_id,
+                   r.department_id,
+                   r.assigned_it_user_id,
+                   r.approved_by_id,
+                   r.create_date,
+                   r.submitted_date,
+                   r.approved_date,
+                   r.started_date,
+                   r.done_date,
+                   1 AS nbr,
+                   EXTRACT(EPOCH FROM r.approved_date - r.submitted_date)
+                       / 3600.0 AS hours_to_approve,
+                   EXTRACT(EPOCH FROM r.started_date
+                       - COALESCE(r.approved_date, r.submitted_date))
+                       / 3600.0 AS hours_to_start,
+                   EXTRACT(EPOCH FROM r.done_date - r.started_date)
+                       / 3600.0 AS hours_to_finish,
+                   EXTRACT(EPOCH FROM r.done_date - r.submitted_date)
+                       / 3600.0 AS hours_total
+        """
+
+    def _from(self):
+        return """
+              FROM it_request r
+        """
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            "CREATE OR REPLACE VIEW %s AS (%s %s)"
+            % (self._table, self._select(), self._from())
+        )
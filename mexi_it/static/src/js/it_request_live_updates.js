@@ -0,0 +1,134 @@
+/** @odoo-module **/
+/* Copyright 2026 Mexilacteos (https://www.mexilacteos.com)
+   License OPL-1.0 */
+
+import { onWillUnmount } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
+import { debounce } from "@web/core/utils/timing";
+import { graphView } from "@web/views/graph/graph_view";
+import { GraphController } from "@web/views/graph/graph_controller";
+import { kanbanView } from "@web/views/kanban/kanban_view";
+import { KanbanController } from "@web/views/kanban/kanban_controller";
+import { listView } from "@web/views/list/list_view";
+import { ListController } from "@web/views/list/list_controller";
+import { pivotView } from "@web/views/pivot/pivot_view";
+import { PivotController } from "@web/views/pivot/pivot_controller";
+
+const NOTIFICATION = "mexi_it.request/changed";
+
+/**
+ * Call `onChanges` with the `{id, state}` changes published by the server,
+ * batched over `delay` milliseconds, while the component is mounted.
+ */
+export function useItRequestLiveUpdates(onChanges, delay = 1000) {
+    const busService = useService("bus_service");
+    let queued = [];
+    const flush = debounce(() => {
+        const changes = queued;
+        queued = [];
+        onChanges(changes);
+    }, delay);
+    const handler = ({ requests }) => {
+        queued.push(...requests);
+        flush();
+    };
+    busService.subscribe(NOTIFICATION, handler);
+    onWillUnmount(() => {
+        busService.unsubscribe(NOTIFICATION, handler);
+        flush.cancel();
+    });
+}
+
+/**
+ * Apply changes to a kanban or list model: changed records still matching
+ * the view are re-read one by one; the view is only reloaded when a
+ * request enters or leaves it, or moves to another column.
+ */
+export async function patchRelationalModel(model, changes) {
+    const root = model.root;
+    const groupBy = root.isGrouped ? root.groupBy[0].split(":")[0] : null;
+    const loaded = new Map();
+    if (root.isGrouped) {
+        for (const group of root.groups) {
+            for (const record of group.list.records) {
+                loaded.set(record.resId, { group, record });
+            }
+        }
+    } else {
+        for (const record of root.records) {
+            loaded.set(record.resId, { record });
+        }
+    }
+
+    const states = new Map(changes.map(({ id, state }) => [id, state]));
+    const matching = new Set(
+        await model.orm.search(
+            model.config.resModel,
+            [...root.domain, ["id", "in", [...states.keys()]]],
+            { context: root.context }
+        )
+    );
+    const toLoad = [];
+    let reload = false;
+    for (const [id, state] of states) {
+        const entry = loaded.get(id);
+        if (!entry) {
+            reload ||= matching.has(id);
+        } else if (!state || !matching.has(id)) {
+            reload = true;
+        } else if (groupBy && (groupBy !== "state" || entry.group.value !== state)) {
+            reload = true;
+        } else if (!entry.record.isDirty) {
+            toLoad.push(entry.record);
+        }
+    }
+    if (reload) {
+        await model.load();
+    } else {
+        await Promise.all(toLoad.map((record) => record.load()));
+    }
+}
+
+export class ItRequestKanbanController extends KanbanController {
+    setup() {
+        super.setup();
+        useItRequestLiveUpdates((changes) => patchRelationalModel(this.model, changes));
+    }
+}
+
+export class ItRequestListController extends ListController {
+    setup() {
+        super.setup();
+        useItRequestLiveUpdates((changes) => patchRelationalModel(this.model, changes));
+    }
+}
+
+// The analysis views aggregate every request: refresh them, less often
+const DASHBOARD_DELAY = 5000;
+
+export class ItRequestGraphController extends GraphController {
+    setup() {
+        super.setup();
+        useItRequestLiveUpdates(
+            () => this.env.searchModel.trigger("update"),
+            DASHBOARD_DELAY
+        );
+    }
+}
+
+export class ItRequestPivotController extends PivotController {
+    setup() {
+        super.setup();
+        useItRequestLiveUpdates(
+            () => this.env.searchModel.trigger("update"),
+            DASHBOARD_DELAY
+        );
+    }
+}
+
+const views = registry.category("views");
+views.add("it_request_kanban", { ...kanbanView, Controller: ItRequestKanbanController });
+views.add("it_request_list", { ...listView, Controller: ItRequestListController });
+views.add("it_request_graph", { ...graphView, Controller: ItRequestGraphController });
+views.add("it_request_pivot", { ...pivotView, Controller: ItRequestPivotController });